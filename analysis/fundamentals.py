@@ -6,6 +6,7 @@ Score: 0 à 3 points
 """
 import logging
 from typing import List, Optional
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
 import time
@@ -65,15 +66,29 @@ class FundamentalsAnalyzer:
             is_valid=True
         )
 
-    def analyze_watchlist(self, symbols: Optional[List[str]] = None) -> List[FundamentalScore]:
-        """Analyse toute la watchlist"""
+    def analyze_watchlist(
+        self,
+        symbols: Optional[List[str]] = None,
+        executor: Optional[Executor] = None
+    ) -> List[FundamentalScore]:
+        """
+        Analyse toute la watchlist
+
+        Args:
+            symbols: Tickers (défaut: config.watchlist)
+            executor: Pool de threads optionnel pour paralléliser les requêtes
+                      (le rate limit Twelve Data reste appliqué par le client)
+        """
         symbols = symbols or config.watchlist
-        results = []
 
-        for i, symbol in enumerate(symbols):
-            results.append(self.analyze(symbol))
-            if i < len(symbols) - 1:
-                time.sleep(0.5)
+        if executor is not None:
+            results = list(executor.map(self.analyze, symbols))
+        else:
+            results = []
+            for i, symbol in enumerate(symbols):
+                results.append(self.analyze(symbol))
+                if i < len(symbols) - 1:
+                    time.sleep(0.5)
 
         # Trier par score décroissant
         results.sort(key=lambda x: x.total_score, reverse=True)
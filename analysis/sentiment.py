@@ -10,6 +10,7 @@ Score: 0 à 3 points
 """
 import logging
 from typing import List, Optional
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
 import time
@@ -182,7 +183,8 @@ class SentimentAnalyzer:
     def analyze_multiple(
         self,
         symbols: List[str],
-        company_names: Optional[dict] = None
+        company_names: Optional[dict] = None,
+        executor: Optional[Executor] = None
     ) -> List[SentimentScore]:
         """
         Analyse le sentiment pour plusieurs actions
@@ -190,11 +192,22 @@ class SentimentAnalyzer:
         Args:
             symbols: Liste de tickers
             company_names: Dict ticker -> nom complet
+            executor: Pool de threads optionnel: les requêtes NewsAPI d'une
+                      action chevauchent l'inférence Ollama d'une autre
+                      (l'inférence reste sérialisée par le client Ollama,
+                      avec pause thermique entre générations enchaînées)
 
         Returns:
             Liste de SentimentScore
         """
         company_names = company_names or {}
+
+        if executor is not None:
+            return list(executor.map(
+                lambda symbol: self.analyze(symbol, company_names.get(symbol)),
+                symbols
+            ))
+
         results = []
 
         for i, symbol in enumerate(symbols):
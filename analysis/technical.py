@@ -9,7 +9,8 @@ Score basé sur:
 Score: 0 à 3 points
 """
 import logging
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
+from concurrent.futures import Executor
 from dataclasses import dataclass
 
 import sys
@@ -52,6 +53,35 @@ class TechnicalScore:
     error: Optional[str] = None
 
 
+class TechView(NamedTuple):
+    """
+    Vue normalisée d'un TechnicalScore pour le scoring des signaux
+
+    Un score absent ou invalide devient une vue neutre (valid=False),
+    ce qui évite de répéter `tech and tech.is_valid` à chaque accès.
+    """
+    valid: bool = False
+    score: float = 1.5  # Score neutre sans données techniques
+    above_ma50: bool = False
+    rsi: Optional[float] = None
+    ma50_distance: float = 0.0
+    price: Optional[float] = None
+    rsi_signal: str = "NEUTRAL"
+
+    @classmethod
+    def from_score(cls, tech: Optional[TechnicalScore]) -> 'TechView':
+        """Construit la vue (vue neutre partagée si pas de données valides)"""
+        if tech is None or not tech.is_valid:
+            return NO_TECH
+        return cls(
+            True, tech.total_score, tech.above_ma50, tech.rsi,
+            tech.ma50_distance, tech.price, tech.rsi_signal
+        )
+
+
+NO_TECH = TechView()
+
+
 class TechnicalAnalyzer:
     """Analyse technique basée sur MM50 et RSI"""
 
@@ -70,36 +100,34 @@ class TechnicalAnalyzer:
 
         RSI = 100 - (100 / (1 + RS))
         RS = Average Gain / Average Loss
+
+        Une seule passe chronologique, sans listes intermédiaires de gains/pertes.
         """
-        if len(prices) < self.rsi_period + 1:
+        period = self.rsi_period
+        n = len(prices)
+        if n < period + 1:
             return None
 
-        # Inverser pour avoir chronologique (ancien → récent)
-        prices = list(reversed(prices))
-
-        gains = []
-        losses = []
-
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
+        avg_gain = 0.0
+        avg_loss = 0.0
+
+        # Parcours chronologique (ancien → récent) sans inverser la liste
+        for k, i in enumerate(range(n - 1, 0, -1)):
+            change = prices[i - 1] - prices[i]
+            gain = change if change > 0 else 0
+            loss = -change if change < 0 else 0
+
+            if k < period:
+                # Moyenne simple pour la première période
+                avg_gain += gain
+                avg_loss += loss
+                if k == period - 1:
+                    avg_gain /= period
+                    avg_loss /= period
             else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        if len(gains) < self.rsi_period:
-            return None
-
-        # Moyenne simple pour la première période
-        avg_gain = sum(gains[:self.rsi_period]) / self.rsi_period
-        avg_loss = sum(losses[:self.rsi_period]) / self.rsi_period
-
-        # Lissage exponentiel pour les périodes suivantes
-        for i in range(self.rsi_period, len(gains)):
-            avg_gain = (avg_gain * (self.rsi_period - 1) + gains[i]) / self.rsi_period
-            avg_loss = (avg_loss * (self.rsi_period - 1) + losses[i]) / self.rsi_period
+                # Lissage exponentiel pour les périodes suivantes
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
 
         if avg_loss == 0:
             return 100.0
@@ -120,6 +148,9 @@ class TechnicalAnalyzer:
         """
         Compte depuis combien de jours le prix est au-dessus de la MM
 
+        La MM est glissée d'un jour à l'autre (somme mobile) au lieu d'être
+        recalculée entièrement à chaque jour.
+
         Returns:
             Nombre de jours consécutifs au-dessus (0 si actuellement en-dessous)
         """
@@ -127,13 +158,14 @@ class TechnicalAnalyzer:
             return 0
 
         days = 0
+        window_sum = sum(closes[:ma_period])
         # Parcourir du plus récent au plus ancien
         for i in range(min(30, len(closes) - ma_period)):
-            # Calculer la MM50 à ce jour
-            ma = sum(closes[i:i + ma_period]) / ma_period
-            price = closes[i]
+            if i > 0:
+                # Décaler la fenêtre d'un jour vers le passé
+                window_sum += closes[i + ma_period - 1] - closes[i - 1]
 
-            if price > ma:
+            if closes[i] > window_sum / ma_period:
                 days += 1
             else:
                 break  # On s'arrête dès qu'on passe en-dessous
@@ -345,18 +377,29 @@ class TechnicalAnalyzer:
         result = self.analyze(symbol)
         return result.is_valid and result.above_ma50 and result.rsi_signal != "OVERBOUGHT"
 
-    def analyze_batch(self, symbols: List[str]) -> List[TechnicalScore]:
-        """Analyse technique de plusieurs actions"""
-        results = []
+    def analyze_batch(
+        self,
+        symbols: List[str],
+        executor: Optional[Executor] = None
+    ) -> List[TechnicalScore]:
+        """
+        Analyse technique de plusieurs actions
 
-        for symbol in symbols:
-            result = self.analyze(symbol)
-            results.append(result)
+        Args:
+            symbols: Tickers à analyser
+            executor: Pool de threads optionnel pour paralléliser les requêtes
+        """
+        if executor is not None:
+            results = list(executor.map(self.analyze, symbols))
+        else:
+            results = [self.analyze(symbol) for symbol in symbols]
 
+        for result in results:
+            symbol = result.symbol
             if result.is_valid:
                 logger.debug(
-                    f"Technical {symbol}: {result.total_score}/3 "
-                    f"(MA50: {result.ma50_distance:+.1f}%, RSI: {result.rsi})"
+                    "Technical %s: %s/3 (MA50: %+.1f%%, RSI: %s)",
+                    symbol, result.total_score, result.ma50_distance, result.rsi
                 )
 
         # Trier par score décroissant
@@ -41,6 +41,8 @@ class OllamaConfig:
     max_retries: int = 3
     num_ctx: int = 2048  # Contexte réduit pour économiser RAM
     num_thread: int = 4  # Threads limités pour éviter surchauffe
+    # Garder le modèle chargé entre les cycles --loop (défaut Ollama: 5 min)
+    keep_alive: str = field(default_factory=lambda: os.getenv("OLLAMA_KEEP_ALIVE", "24h"))
 
 
 @dataclass(frozen=True)
@@ -87,10 +89,12 @@ class CacheConfig:
     market_cache_size: int = 50
     news_cache_size: int = 100
     sentiment_cache_size: int = 200
+    headline_cache_size: int = 1000  # Sentiment par titre (persistant)
     # TTL en secondes
     market_ttl: int = 300       # 5 minutes
     news_ttl: int = 900         # 15 minutes
     sentiment_ttl: int = 3600   # 1 heure
+    headline_ttl: int = 86400   # 24h - une dépêche ne change pas de ton
 
 
 @dataclass(frozen=True)
@@ -21,6 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import config
 from utils.decorators import retry_with_backoff, CircuitBreaker
 from utils.cache import ttl_lru_cache
+from utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,9 @@ _news_api_cb = CircuitBreaker(
     exceptions=(requests.RequestException, ConnectionError, TimeoutError, ValueError)
 )
 
+# Session partagée (keep-alive: pas de handshake TLS à chaque requête)
+_session = create_session()
+
 
 @dataclass
 class NewsArticle:
@@ -67,6 +71,7 @@ class NewsAPIClient:
         self.api_key = config.news_api.api_key
         self.base_url = config.news_api.base_url
         self.timeout = config.news_api.timeout
+        self.session = _session  # Connexions keep-alive partagées
 
     @_news_api_cb
     @retry_with_backoff(
@@ -89,12 +94,12 @@ class NewsAPIClient:
         url = f"{self.base_url}/{endpoint}"
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             
             query_info = params.get('q', 'unknown')
-            logger.debug(f"NewsAPI URL: {url}?q={query_info}")
+            logger.debug("NewsAPI URL: %s?q=%s", url, query_info)
 
             if data.get("status") != "ok":
                 raise ValueError(f"API Error: {data.get('message', 'Unknown')}")
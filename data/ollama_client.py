@@ -11,6 +11,9 @@ Timeout: 120s (Pi peut être lent)
 import requests
 import json
 import re
+import hashlib
+import threading
+import time
 import logging
 from typing import Optional
 from dataclasses import dataclass
@@ -21,11 +24,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import config
-from utils.decorators import retry_with_backoff
-from utils.cache import ttl_lru_cache
+from utils.decorators import retry_with_backoff, thermal_aware
+from utils.cache import ttl_lru_cache, get_persistent_cache_manager
+from utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# Session partagée (keep-alive vers le serveur Ollama local)
+_session = create_session()
+
 
 class Sentiment(Enum):
     """Sentiment d'une news"""
@@ -134,14 +141,24 @@ JSON:"""
         self.timeout = config.ollama.timeout
         self.num_ctx = config.ollama.num_ctx
         self.num_thread = config.ollama.num_thread
+        self.keep_alive = config.ollama.keep_alive
+        # Un seul modèle chargé sur le Pi: une génération à la fois
+        self._generate_lock = threading.Lock()
+        # Générations en attente du verrou (pause thermique seulement si > 0)
+        self._generate_waiting = 0
+        self._waiting_lock = threading.Lock()
+        self.session = _session  # Connexion keep-alive vers le serveur local
         # Diagnostics
         self.diagnostics = LLMDiagnostics()
         self.debug_mode = False  # Activer pour logs détaillés
+        # Cache sentiment par titre (créé à la première utilisation)
+        self._headline_cache = None
+        self._headline_cache_lock = threading.Lock()
 
     def is_available(self) -> bool:
         """Vérifie si le serveur Ollama est disponible"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
@@ -149,6 +166,35 @@ JSON:"""
         except requests.RequestException:
             return False
 
+    def load_model(self) -> bool:
+        """
+        Charge le modèle en mémoire et l'y maintient (keep_alive)
+
+        Un prompt vide ne génère rien: seul le chargement est payé.
+
+        Returns:
+            True si le modèle est chargé
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model, "keep_alive": self.keep_alive},
+                timeout=self.timeout
+            )
+            return response.status_code == 200
+        except requests.RequestException as e:
+            logger.warning("Ollama model load failed: %s", e)
+            return False
+
+    @thermal_aware(
+        warning_temp=config.thermal.cpu_temp_warning,
+        critical_temp=config.thermal.cpu_temp_critical,
+        cooldown=config.thermal.cooldown_delay
+    )
+    def _thermal_pause(self):
+        """Pause entre deux générations enchaînées (allongée si le CPU chauffe)"""
+        time.sleep(config.thermal.inter_request_delay)
+
     @retry_with_backoff(
         exceptions=(requests.RequestException, ConnectionError, TimeoutError),
         max_retries=2,  # Moins de retries car Ollama peut être lent
@@ -168,6 +214,7 @@ JSON:"""
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {
                 "num_ctx": self.num_ctx,
                 "num_thread": self.num_thread,
@@ -177,15 +224,26 @@ JSON:"""
         }
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
+            # Sérialise l'inférence entre threads (les requêtes news continuent en parallèle)
+            with self._waiting_lock:
+                self._generate_waiting += 1
+            with self._generate_lock:
+                with self._waiting_lock:
+                    self._generate_waiting -= 1
+                response = self.session.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                    timeout=self.timeout
+                )
+                # Un autre thread attend: pause sous le verrou pour que les
+                # générations concurrentes ne s'enchaînent pas sans refroidir
+                # (appels isolés et chemin séquentiel: pas de pause ici)
+                if self._generate_waiting:
+                    self._thermal_pause()
             response.raise_for_status()
             result = response.json()
             
-            logger.debug(f"Ollama API Response: {result}")
+            logger.debug("Ollama API Response: %s", result)
             
             return result.get("response", "")
 
@@ -591,6 +649,25 @@ JSON:"""
                 is_valid=True
             )
 
+    @staticmethod
+    def _headline_key(text: str) -> str:
+        """Clé de cache d'un titre: sha1 du texte normalisé (tel qu'envoyé au LLM)"""
+        normalized = " ".join((text or "")[:200].lower().split())
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def _get_headline_cache(self):
+        """Cache persistant des sentiments par titre (survit aux cycles --loop)"""
+        if self._headline_cache is None:
+            # Premiers lots concurrents (pool de threads): une seule création
+            with self._headline_cache_lock:
+                if self._headline_cache is None:
+                    self._headline_cache = get_persistent_cache_manager().get_or_create(
+                        "sentiment_headlines",
+                        maxsize=config.cache.headline_cache_size,
+                        ttl=config.cache.headline_ttl
+                    )
+        return self._headline_cache
+
     def analyze_sentiment_batch(self, texts: list) -> list:
         """
         Analyse le sentiment de plusieurs textes en une seule requête
@@ -599,6 +676,9 @@ JSON:"""
         - Une seule requête réseau
         - Le modèle reste chargé en mémoire
 
+        Les titres déjà analysés (même dépêche reprise pour plusieurs
+        symboles) sont servis depuis le cache sans appel au LLM.
+
         Args:
             texts: Liste de textes à analyser
 
@@ -608,6 +688,47 @@ JSON:"""
         if not texts:
             return []
 
+        cache = self._get_headline_cache()
+        keys = [self._headline_key(t) for t in texts]
+        results = [None] * len(texts)
+        missing = []
+
+        for i, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is not None:
+                results[i] = SentimentResult(
+                    sentiment=Sentiment(cached["sentiment"]),
+                    confidence=cached["confidence"],
+                    is_valid=True
+                )
+            else:
+                missing.append(i)
+
+        if not missing:
+            logger.debug("Sentiment batch: %d titres servis depuis le cache", len(texts))
+            return results
+
+        fresh = self._analyze_sentiment_batch([texts[i] for i in missing])
+
+        for i, result in zip(missing, fresh):
+            results[i] = result
+            # Ne mémoriser que les réponses du LLM (pas les fallbacks)
+            if result.is_valid and result.reasoning is None and result.error is None:
+                cache.set(keys[i], {
+                    "sentiment": result.sentiment.value,
+                    "confidence": result.confidence
+                })
+
+        if len(missing) < len(texts):
+            logger.debug(
+                f"Sentiment batch: {len(texts) - len(missing)}/{len(texts)} titres en cache"
+            )
+
+        return results
+
+    def _analyze_sentiment_batch(self, texts: list) -> list:
+        """Appel LLM batch (sans cache)"""
+
         # Vérifier disponibilité Ollama
         if not self.is_available():
             logger.debug("Ollama not available, using fallback for batch")
@@ -657,8 +778,17 @@ JSON:"""
             ]
 
     def _parse_batch_response(self, response: str, original_texts: list) -> list:
-        """Parse la réponse batch et retourne les résultats"""
-        results = []
+        """
+        Parse la réponse batch et retourne les résultats
+
+        Chaque ligne est rattachée à son titre par l'id renvoyé (1-based).
+        Les lignes sans id exploitable comblent les trous dans l'ordre, mais
+        portent un `reasoning` pour ne pas être mises en cache: l'alignement
+        n'est pas garanti si le modèle a sauté ou dupliqué un titre.
+        """
+        count = len(original_texts)
+        results = [None] * count
+        unmatched = []
         lines = response.strip().split('\n')
 
         sentiment_map = {
@@ -670,31 +800,55 @@ JSON:"""
             "NEUTRAL": Sentiment.NEUTRAL
         }
 
-        parsed_count = 0
         for line in lines:
             parsed = self._parse_json_response(line)
-            if parsed and parsed_count < len(original_texts):
-                sentiment_str = parsed.get("sentiment", "").upper()
-                sentiment = sentiment_map.get(sentiment_str, Sentiment.NEUTRAL)
+            if not parsed:
+                continue
+
+            sentiment_str = str(parsed.get("sentiment", "")).upper()
+            sentiment = sentiment_map.get(sentiment_str, Sentiment.NEUTRAL)
+            try:
                 confidence = float(parsed.get("confidence", 0.5))
-                confidence = max(0.0, min(1.0, confidence))
+            except (TypeError, ValueError):
+                confidence = 0.5
+            confidence = max(0.0, min(1.0, confidence))
 
-                results.append(SentimentResult(
+            try:
+                idx = int(parsed.get("id")) - 1
+            except (TypeError, ValueError):
+                idx = -1
+
+            if 0 <= idx < count and results[idx] is None:
+                results[idx] = SentimentResult(
                     sentiment=sentiment,
                     confidence=confidence,
                     is_valid=True
-                ))
-                parsed_count += 1
-
-        # Compléter avec fallback si parsing incomplet
-        while len(results) < len(original_texts):
-            idx = len(results)
-            results.append(SentimentResult(
-                sentiment=self._fallback_sentiment(original_texts[idx]),
-                confidence=0.3,
-                reasoning="Fallback - batch parsing incomplete",
-                is_valid=True
-            ))
+                )
+            else:
+                unmatched.append((sentiment, confidence))
+
+        if unmatched:
+            logger.debug("Sentiment batch: %d réponses sans id exploitable", len(unmatched))
+
+        # Trous: réponses sans id dans l'ordre, puis fallback mots-clés
+        for idx in range(count):
+            if results[idx] is not None:
+                continue
+            if unmatched:
+                sentiment, confidence = unmatched.pop(0)
+                results[idx] = SentimentResult(
+                    sentiment=sentiment,
+                    confidence=confidence,
+                    reasoning="Batch - id manquant, alignement par position",
+                    is_valid=True
+                )
+            else:
+                results[idx] = SentimentResult(
+                    sentiment=self._fallback_sentiment(original_texts[idx]),
+                    confidence=0.3,
+                    reasoning="Fallback - batch parsing incomplete",
+                    is_valid=True
+                )
 
         return results
 
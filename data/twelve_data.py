@@ -9,10 +9,12 @@ Plan gratuit: 800 requêtes/jour
 """
 import requests
 import time
+import threading
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, time as dtime, timedelta
+from functools import wraps
 
 import sys
 from pathlib import Path
@@ -20,7 +22,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import config
 from utils.decorators import retry_with_backoff, CircuitBreaker
-from utils.cache import ttl_lru_cache
+from utils.cache import TTLCache, ttl_lru_cache
+from utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,149 @@ _twelve_data_cb = CircuitBreaker(
     exceptions=(requests.RequestException, ConnectionError, TimeoutError, ValueError)
 )
 
+# Session partagée (keep-alive: pas de handshake TLS à chaque requête)
+_session = create_session()
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # zoneinfo absent: pas de cache par séance
+    ZoneInfo = None
+
+
+def _zone(name: str):
+    """Fuseau horaire, ou None si zoneinfo/tzdata indisponible"""
+    try:
+        return ZoneInfo(name) if ZoneInfo else None
+    except Exception:
+        return None
+
+
+# Séance par place de cotation (suffixe du ticker): fuseau, ouverture, clôture
+# (marge après la clôture officielle pour les cours de clôture définitifs)
+_EXCHANGE_SESSIONS = {
+    "": (_zone("America/New_York"), dtime(9, 30), dtime(16, 30)),  # NYSE/Nasdaq
+    ".PA": (_zone("Europe/Paris"), dtime(9, 0), dtime(18, 0)),     # Euronext Paris
+    ".DE": (_zone("Europe/Berlin"), dtime(9, 0), dtime(18, 0)),    # Xetra
+}
+
+# Cache par séance: hors marché, cotations et historiques journaliers sont figés
+# jusqu'à la prochaine ouverture (TTL de 4 jours pour couvrir un week-end prolongé)
+_SESSION_CACHE_SIZE = 128  # Par méthode décorée
+_SESSION_CACHE_TTL = 4 * 86400
+
+
+# "BRK.B": suffixes de classe d'action US, pas des places de cotation
+_SHARE_CLASS_SUFFIXES = frozenset((".A", ".B", ".C"))
+
+
+def _exchange_session(symbol: str):
+    """Séance de la place d'un ticker (None si place inconnue: pas de cache)"""
+    dot = symbol.rfind(".")
+    suffix = symbol[dot:].upper() if dot >= 0 else ""
+    if suffix in _SHARE_CLASS_SUFFIXES:
+        suffix = ""
+    return _EXCHANGE_SESSIONS.get(suffix)
+
+
+def market_session_key(symbol: str = "", now: Optional[datetime] = None) -> Optional[str]:
+    """
+    Identifiant de la dernière séance clôturée sur la place du symbole
+
+    Args:
+        symbol: Ticker (suffixe .PA/.DE -> Euronext/Xetra, sinon NYSE)
+        now: Instant de référence (défaut: maintenant)
+
+    Returns:
+        Date (YYYY-MM-DD, heure locale de la place) de la dernière clôture,
+        ou None si le marché est ouvert (ou place/fuseau inconnu).
+        Les jours fériés sont traités comme des séances: au pire un
+        cache miss, jamais une donnée périmée.
+    """
+    session = _exchange_session(symbol)
+    if session is None or session[0] is None:
+        return None
+    tz, open_time, close_time = session
+
+    local = (now or datetime.now(tz)).astimezone(tz)
+    day = local.date()
+
+    if local.weekday() < 5:
+        if open_time <= local.time() < close_time:
+            return None
+        if local.time() >= close_time:
+            return day.isoformat()
+
+    # Avant l'ouverture ou week-end: dernier jour ouvré précédent
+    day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.isoformat()
+
+
+def session_cached(func: Callable) -> Callable:
+    """
+    Cache les résultats valides pour la durée de la séance clôturée
+
+    La séance est celle de la place du symbole (premier argument): une
+    action parisienne n'est pas figée pendant que NYSE est fermé.
+    En mode --loop, évite de refaire les mêmes requêtes chaque heure
+    la nuit et le week-end. Marché ouvert: appel direct (le cache TTL
+    court de la méthode s'applique).
+
+    Chaque méthode a son propre cache de séance: `cache_clear()` vide
+    celui-ci et le cache TTL interne (ttl_lru_cache), `session_cache_clear()`
+    uniquement le cache de séance. `cache_peek()`/`cache_put()` consultent
+    et alimentent les deux sans requête.
+    """
+    session_cache = TTLCache(maxsize=_SESSION_CACHE_SIZE, ttl=_SESSION_CACHE_TTL)
+    inner_clear = getattr(func, "cache_clear", None)
+    inner_peek = getattr(func, "cache_peek", None)
+    inner_put = getattr(func, "cache_put", None)
+
+    @wraps(func)
+    def wrapper(self, symbol: str, *args, **kwargs):
+        session = market_session_key(symbol)
+        if session is None:
+            return func(self, symbol, *args, **kwargs)
+
+        key = (symbol, args, tuple(sorted(kwargs.items())), session)
+        result = session_cache.get(key)
+        if result is None:
+            result = func(self, symbol, *args, **kwargs)
+            if getattr(result, "is_valid", False):
+                session_cache.set(key, result)
+        return result
+
+    def cache_clear():
+        session_cache.clear()
+        if inner_clear is not None:
+            inner_clear()
+
+    def cache_peek(self, symbol: str, *args, **kwargs):
+        session = market_session_key(symbol)
+        if session is not None:
+            result = session_cache.get((symbol, args, tuple(sorted(kwargs.items())), session))
+            if result is not None:
+                return result
+        if inner_peek is not None:
+            return inner_peek(self, symbol, *args, **kwargs)
+        return None
+
+    def cache_put(value, self, symbol: str, *args, **kwargs):
+        if not getattr(value, "is_valid", False):
+            return
+        if inner_put is not None:
+            inner_put(value, self, symbol, *args, **kwargs)
+        session = market_session_key(symbol)
+        if session is not None:
+            session_cache.set((symbol, args, tuple(sorted(kwargs.items())), session), value)
+
+    wrapper.cache_clear = cache_clear
+    wrapper.session_cache_clear = session_cache.clear
+    wrapper.cache_peek = cache_peek
+    wrapper.cache_put = cache_put
+    return wrapper
+
 
 @dataclass
 class StockQuote:
@@ -75,9 +221,11 @@ class TwelveDataClient:
         self.api_key = config.twelve_data.api_key
         self.base_url = config.twelve_data.base_url
         self.timeout = config.twelve_data.timeout
+        self.session = _session  # Connexions keep-alive partagées
         self._request_times = []  # Fenêtre glissante des requêtes
         self._max_requests_per_minute = config.twelve_data.requests_per_minute
         self._min_delay = config.twelve_data.request_delay
+        self._rate_lock = threading.Lock()  # Fenêtre partagée entre threads
 
     def _enforce_rate_limit(self, credits_used: int = 1):
         """
@@ -93,7 +241,12 @@ class TwelveDataClient:
         Args:
             credits_used: Nombre de crédits que cette requête va utiliser
         """
-        now = time.time()
+        with self._rate_lock:
+            self._wait_for_credits(credits_used)
+
+    def _wait_for_credits(self, credits_used: int):
+        """Attend si nécessaire puis réserve les crédits (appelé sous _rate_lock)"""
+        now = time.monotonic()
 
         # 1. Nettoyer les requêtes de plus d'une minute
         self._request_times = [(t, c) for t, c in self._request_times if now - t < 60]
@@ -109,7 +262,7 @@ class TwelveDataClient:
                 if wait_time > 0:
                     logger.warning(f"Rate limit: {total_credits}/{self._max_requests_per_minute} crédits, waiting {wait_time:.1f}s...")
                     time.sleep(wait_time)
-                    now = time.time()
+                    now = time.monotonic()
                     self._request_times = [(t, c) for t, c in self._request_times if now - t < 60]
 
         # 4. Respecter le délai minimum entre requêtes
@@ -118,7 +271,7 @@ class TwelveDataClient:
             if elapsed < self._min_delay:
                 time.sleep(self._min_delay - elapsed)
 
-        self._request_times.append((time.time(), credits_used))
+        self._request_times.append((time.monotonic(), credits_used))
 
     @_twelve_data_cb
     @retry_with_backoff(
@@ -141,17 +294,39 @@ class TwelveDataClient:
         params["apikey"] = self.api_key
         url = f"{self.base_url}{endpoint}"
 
-        response = requests.get(url, params=params, timeout=self.timeout)
+        response = self.session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
         data = response.json()
 
-        logger.debug(f"TwelveData {endpoint}: {params.get('symbol', 'unknown')} ({credits} crédits)")
+        logger.debug("TwelveData %s: %s (%d crédits)", endpoint, params.get('symbol', 'unknown'), credits)
 
         if "code" in data and data.get("status") == "error":
             raise ValueError(f"API Error: {data.get('message', 'Unknown error')}")
 
         return data
 
+    def ping(self, symbol: str = "AAPL", timeout: float = 5.0) -> bool:
+        """
+        Vérifie que l'API répond (health check)
+
+        Requête /quote directe: sans cache (séance ou TTL), sans retry ni
+        circuit breaker, pour refléter l'état réel de l'API maintenant.
+        """
+        self._enforce_rate_limit(1)
+        try:
+            response = self.session.get(
+                f"{self.base_url}/quote",
+                params={"symbol": symbol, "apikey": self.api_key},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data.get("status") != "error" and "close" in data
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Twelve Data ping failed: %s", e)
+            return False
+
+    @session_cached
     @ttl_lru_cache(maxsize=50, ttl=300)
     def get_quote(self, symbol: str) -> StockQuote:
         """Récupère le prix actuel via Twelve Data"""
@@ -169,7 +344,7 @@ class TwelveDataClient:
             )
 
         except Exception as e:
-            logger.debug(f"Quote failed for {symbol}: {e}")
+            logger.debug("Quote failed for %s: %s", symbol, e)
             return StockQuote(symbol=symbol, is_valid=False, error=str(e))
 
     @ttl_lru_cache(maxsize=50, ttl=600)
@@ -206,9 +381,11 @@ class TwelveDataClient:
             )
 
         except Exception as e:
-            logger.debug(f"Fundamentals failed for {symbol}: {e}")
+            logger.debug("Fundamentals failed for %s: %s", symbol, e)
             return StockFundamentals(symbol=symbol, is_valid=False, error=str(e))
 
+    @session_cached
+    @ttl_lru_cache(maxsize=100, ttl=900)
     def get_time_series(
         self,
         symbol: str,
@@ -239,7 +416,7 @@ class TwelveDataClient:
             return HistoricalData(symbol=symbol, prices=prices, is_valid=True)
 
         except Exception as e:
-            logger.debug(f"Time series failed for {symbol}: {e}")
+            logger.debug("Time series failed for %s: %s", symbol, e)
             return HistoricalData(symbol=symbol, is_valid=False, error=str(e))
 
     def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
@@ -299,6 +476,44 @@ class TwelveDataClient:
 
         return results
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Prix actuels de plusieurs symboles
+
+        Les caches de get_quote (TTL court et séance clôturée) sont consultés
+        d'abord. Les symboles restants passent par get_quote s'il n'y en a
+        qu'un, sinon par /quote batch en paquets de la taille du quota
+        minute (1 crédit par symbole); les cotations batch alimentent
+        ensuite les caches de get_quote.
+
+        Returns:
+            Dict symbole -> prix (symboles sans cotation valide omis)
+        """
+        get_quote = type(self).get_quote
+        quotes = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            quote = get_quote.cache_peek(self, symbol)
+            if quote is None:
+                missing.append(symbol)
+            else:
+                quotes[symbol] = quote
+
+        if len(missing) == 1:
+            quotes[missing[0]] = self.get_quote(missing[0])
+        elif missing:
+            batch_size = config.twelve_data.requests_per_minute
+            for i in range(0, len(missing), batch_size):
+                batch = self.get_multiple_quotes(missing[i:i + batch_size])
+                for symbol, quote in batch.items():
+                    get_quote.cache_put(quote, self, symbol)
+                quotes.update(batch)
+
+        return {
+            symbol: quote.price for symbol, quote in quotes.items()
+            if quote.is_valid and quote.price is not None
+        }
+
     def _parse_quote_data(self, data: Dict[str, Any]) -> StockQuote:
         """Parse les données d'une quote depuis la réponse API"""
         symbol = data.get("symbol", "UNKNOWN")
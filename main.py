@@ -3,23 +3,36 @@
 main.py - PiTrader Orchestrator
 
 Analyse Top-Down: Market -> Momentum -> Sentiment -> Signals
+
+Les modules lourds (clients API, analyse, Telegram) sont importés dans les
+fonctions qui s'en servent: --health et --validate-llm ne chargent que le
+nécessaire (import à froid lent sur carte SD).
 """
+from __future__ import annotations
+
 import argparse
+import atexit
+import os
+import queue
 import logging
+import logging.handlers
+import re
+import threading
 import time
 import gc
-from datetime import datetime
-from typing import List, Optional
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from config import config
-from analysis.market_context import market_analyzer, MarketContext
-from analysis.fundamentals import fundamentals_analyzer, FundamentalScore
-from analysis.sentiment import sentiment_analyzer, SentimentScore
-from analysis.technical import technical_analyzer, TechnicalScore
-from storage.signals_store import signals_store, SignalRecord
-from telegram import telegram_bot
-from data.ollama_client import ollama_client
-from data.twelve_data import twelve_data_client
+from utils.memory import MemoryMonitor
+
+if TYPE_CHECKING:
+    from analysis.market_context import MarketContext
+    from analysis.fundamentals import FundamentalScore
+    from analysis.sentiment import SentimentScore
+    from analysis.technical import TechnicalScore, TechView
+    from storage.signals_store import SignalRecord
 
 # Logging avec format stylisé
 class ColoredFormatter(logging.Formatter):
@@ -33,29 +46,44 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',   # Magenta
         'RESET': '\033[0m'        # Reset
     }
-    
+
+    # Raccourcis des noms de modules pour un affichage plus court
+    _MODULE_RE = re.compile(r'__main__|data\.twelve_data|data\.|analysis\.')
+    _MODULE_SHORT = {
+        '__main__': 'PiTrader',
+        'data.twelve_data': '12data',
+        'data.': '',
+        'analysis.': '',
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS['RESET']
+        # Chaînes colorées précalculées par numéro de niveau, déjà alignées
+        # (le padding %-8s compterait les codes ANSI et ne s'appliquerait pas)
+        self._levels = {
+            logging.getLevelName(level): f"{color}{level:<8}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+        # Noms de modules raccourcis, calculés une fois par logger
+        self._names: Dict[str, str] = {}
+
+    def _short_name(self, name: str) -> str:
+        short = self._names.get(name)
+        if short is None:
+            short = self._MODULE_RE.sub(lambda m: self._MODULE_SHORT[m.group()], name)
+            self._names[name] = short
+        return short
+
     def format(self, record):
-        # Ajouter des couleurs seulement pour la console
-        if hasattr(record, 'levelname'):
-            color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-            record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        
-        # Formater le message
-        formatted = super().format(record)
-        
-        # Nettoyer les noms de modules pour un affichage plus court
-        if '__main__' in formatted:
-            formatted = formatted.replace('__main__', 'PiTrader')
-        elif 'data.' in formatted:
-            module = formatted.split(' │ ')[1]
-            short_module = module.replace('data.', '').replace('twelve_data', '12data')
-            formatted = formatted.replace(module, short_module)
-        elif 'analysis.' in formatted:
-            module = formatted.split(' │ ')[1]
-            short_module = module.replace('analysis.', '')
-            formatted = formatted.replace(module, short_module)
-            
-        return formatted
+        # Le record est partagé avec le handler fichier: restaurer après formatage
+        levelname, name = record.levelname, record.name
+        record.levelname = self._levels.get(record.levelno, levelname)
+        record.name = self._short_name(name)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname, record.name = levelname, name
 
 # Configuration du logging
 console_formatter = ColoredFormatter(
@@ -68,72 +96,151 @@ file_formatter = logging.Formatter(
     datefmt='%H:%M:%S'
 )
 
-# Configuration principale
-logging.basicConfig(
-    level=logging.DEBUG,
-    handlers=[]
-)
-
 # Handler console avec couleurs
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(console_formatter)
 
-# Handler fichier sans couleurs
-file_handler = logging.FileHandler('pitrader.log')
+# Handler fichier sans couleurs, avec rotation (5 Mo x 3) pour le mode --loop
+file_handler = logging.handlers.RotatingFileHandler(
+    'pitrader.log',
+    maxBytes=5_000_000,
+    backupCount=3,
+    encoding='utf-8'
+)
 file_handler.setFormatter(file_formatter)
 
-# Appliquer les handlers
+# Appliquer les handlers via une file: les threads d'analyse ne font qu'empiler
+# les records, l'écriture console/SD est faite par un thread dédié
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # Vide la file avant la sortie
+
 root_logger = logging.getLogger()
-root_logger.setLevel(logging.DEBUG)
-root_logger.addHandler(console_handler)
-root_logger.addHandler(file_handler)
+root_logger.setLevel(logging.INFO)  # Ajustable via --log-level
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 logging.getLogger('urllib3').setLevel(logging.ERROR)
 logging.getLogger('requests').setLevel(logging.ERROR)
 
 logger = logging.getLogger(__name__)
 
+# Threads par défaut (requêtes HTTP = attente I/O, pas de GIL): ajustable via --workers
+DEFAULT_WORKERS = min(10, (os.cpu_count() or 1) * 4)
+
+# Collecte GC partielle (générations 0-1) tous les N cycles en mode --loop,
+# pendant la pause plutôt qu'à la fin de chaque analyse. Sous pression
+# mémoire, MemoryMonitor.check_and_cleanup() collecte après chaque cycle
+GC_EVERY_N_CYCLES = 10
+
+
+# Sondes de santé (pas de cache: chaque --health est un nouveau processus)
+def _probe_ollama() -> bool:
+    from data.ollama_client import ollama_client
+    return ollama_client.is_available()
+
+
+def _probe_twelve_data() -> bool:
+    from data.twelve_data import twelve_data_client
+    # Requête directe: le cache de séance masquerait une API en panne
+    return twelve_data_client.ping("AAPL")
+
+
+def _probe_news_api() -> bool:
+    from data.news_client import news_client
+    return news_client.search_news("test", page_size=1).is_valid
+
+
+def _probe_telegram() -> bool:
+    return bool(config.telegram.bot_token and config.telegram.chat_id)
+
+
+# Modules du cycle complet, chargés avant gc.freeze() (hors --health/--validate-llm)
+_PIPELINE_MODULES = (
+    "analysis.market_context",
+    "analysis.fundamentals",
+    "analysis.technical",
+    "analysis.sentiment",
+    "storage.signals_store",
+)
+
+# Délai max du health check complet (sonde plus lente = service KO)
+# Les sondes tournent dans des threads daemon: une sonde bloquée au-delà
+# de ce délai est abandonnée et ne retarde pas la sortie du processus
+HEALTH_CHECK_TIMEOUT = 10
+
+_HEALTH_PROBES = {
+    "ollama": _probe_ollama,
+    "twelve_data": _probe_twelve_data,
+    "news_api": _probe_news_api,
+    "telegram": _probe_telegram,
+}
+
 
 class PiTrader:
     """Bot de trading Top-Down"""
 
-    def __init__(self, test_mode: bool = False, debug_telegram: bool = False):
+    def __init__(
+        self,
+        test_mode: bool = False,
+        debug_telegram: bool = False,
+        workers: int = DEFAULT_WORKERS
+    ):
         self.test_mode = test_mode
         self.debug_telegram = debug_telegram
+        # Pool de threads partagé entre les cycles
+        # Plafonné par la taille de la watchlist pour ménager les APIs
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(config.watchlist))),
+            thread_name_prefix="pitrader"
+        )
+        # Message de démarrage envoyé avec le premier résumé (1 requête au lieu de 2)
+        self.startup_banner: Optional[str] = None
+        # Index par symbole des phases 3/4 (construits une fois par cycle)
+        self._tech_map: Dict[str, TechnicalScore] = {}
+        self._sent_map: Dict[str, SentimentScore] = {}
 
     def health_check(self) -> dict:
-        """Vérifie l'état de tous les services"""
-        status = {
-            "ollama": False,
-            "twelve_data": False,
-            "news_api": False,
-            "telegram": False
-        }
-
-        # Test Ollama
-        try:
-            status["ollama"] = ollama_client.is_available()
-        except Exception:
-            pass
+        """
+        Vérifie l'état de tous les services (sondes en parallèle)
 
-        # Test Twelve Data (avec un ticker simple)
-        try:
-            quote = twelve_data_client.get_quote("AAPL")
-            status["twelve_data"] = quote.is_valid
-        except Exception:
-            pass
+        Chaque sonde tourne dans un thread daemon hors du pool partagé:
+        le pool est joint à la sortie de l'interpréteur, un thread daemon
+        non. Une sonde sans réponse après HEALTH_CHECK_TIMEOUT est marquée
+        KO et ne bloque pas la fin de --health.
+        """
+        results: queue.Queue = queue.Queue()
 
-        # Test NewsAPI
-        try:
-            result = news_client.search_news("test", page_size=1)
-            status["news_api"] = result.is_valid
-        except Exception:
-            pass
+        def run(name, probe):
+            try:
+                results.put((name, bool(probe())))
+            except Exception:
+                results.put((name, False))
+
+        for name, probe in _HEALTH_PROBES.items():
+            threading.Thread(
+                target=run, args=(name, probe),
+                name=f"health-{name}", daemon=True
+            ).start()
+
+        status = dict.fromkeys(_HEALTH_PROBES, False)
+        pending = set(_HEALTH_PROBES)
+        deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                name, ok = results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            status[name] = ok
+            pending.discard(name)
 
-        # Test Telegram
-        try:
-            status["telegram"] = bool(config.telegram.bot_token and config.telegram.chat_id)
-        except Exception:
-            pass
+        if pending:
+            logger.warning("Health check: pas de réponse de %s", ", ".join(sorted(pending)))
 
         return status
 
@@ -143,21 +250,26 @@ class PiTrader:
 
         Attend indéfiniment jusqu'à ce qu'Ollama soit disponible.
         """
+        from data.ollama_client import ollama_client
+
         logger.info("🔥 Warmup Ollama...")
 
         # Attendre qu'Ollama soit disponible (attente infinie)
         waited = 0
         while not ollama_client.is_available():
-            logger.info(f"   → Attente Ollama... ({waited}s)")
+            logger.info("   → Attente Ollama... (%ds)", waited)
             time.sleep(10)
             waited += 10
 
-        # Ollama disponible, charger le modèle
+        # Ollama disponible, charger et épingler le modèle (keep_alive)
+        if not ollama_client.load_model():
+            logger.warning("   → Chargement explicite du modèle échoué")
+
         try:
             ollama_client.analyze_sentiment("Warming up the model.")
             logger.info("   → Ollama prêt")
         except Exception as e:
-            logger.warning(f"   → Warmup sentiment échoué: {e}, mais Ollama est disponible")
+            logger.warning("   → Warmup sentiment échoué: %s, mais Ollama est disponible", e)
 
     def run_full_analysis(self) -> int:
         """
@@ -166,143 +278,174 @@ class PiTrader:
         Returns:
             Nombre de signaux générés (ou -1 en cas d'erreur)
         """
-        start = datetime.now()
+        from analysis.market_context import market_analyzer
+        from analysis.fundamentals import fundamentals_analyzer
+        from analysis.sentiment import sentiment_analyzer
+        from analysis.technical import technical_analyzer
+        from telegram import telegram_bot
+
+        start = time.perf_counter()
         signals = []
         error_msg = None
+        self._tech_map = {}
+        self._sent_map = {}
 
         logger.info("═" * 50)
-        logger.info(f"🚀 PiTrader - Analyse de {len(config.watchlist)} actions")
+        logger.info("🚀 PiTrader - Analyse de %d actions", len(config.watchlist))
         logger.info("═" * 50)
 
         try:
-            # Phase 1: Market
+            # Phase 1: Market (en arrière-plan, indépendante de la phase 2)
             logger.info("📊 Phase 1: Analyse Marché...")
-            market = market_analyzer.analyze()
-            logger.info(f"   → Score marché: {market.market_score:+d}")
+            market_future = self.executor.submit(market_analyzer.analyze)
 
             # Phase 2: Momentum
             logger.info("📈 Phase 2: Analyse Momentum...")
-            fundamentals = fundamentals_analyzer.analyze_watchlist()
-            valid = [f for f in fundamentals if f.is_valid]
-            logger.info(f"   → {len(valid)} actions analysées")
-
-            # Phase 3: Technique (top 10 momentum)
-            logger.info("📉 Phase 3: Analyse Technique...")
-            top_momentum = [f.symbol for f in fundamentals[:10] if f.is_valid]
-            technicals = technical_analyzer.analyze_batch(top_momentum)
-
-            # Phase 4: Sentiment (top 5 après filtre technique)
-            logger.info("💬 Phase 4: Analyse Sentiment...")
-            # Filtrer: garder seulement ceux au-dessus de MM50
-            bullish_symbols = [t.symbol for t in technicals if t.is_valid and t.above_ma50][:5]
-            sentiments = sentiment_analyzer.analyze_multiple(bullish_symbols) if bullish_symbols else []
+            fundamentals = fundamentals_analyzer.analyze_watchlist(executor=self.executor)
+
+            market = market_future.result()
+            logger.info("   → Score marché: %+d", market.market_score)
+            # Déjà trié par score: un seul filtre, réutilisé par toutes les phases
+            valid_funds = [f for f in fundamentals if f.is_valid]
+            logger.info("   → %d actions analysées", len(valid_funds))
+
+            if market.market_score < 0 and not self.test_mode:
+                # Condition bloquante: aucun signal possible sur marché négatif,
+                # inutile de payer les requêtes techniques et l'inférence LLM
+                logger.info("   ⛔ Marché défavorable - Phases 3-5 ignorées")
+            else:
+                # Phase 3: Technique (top 10 momentum)
+                logger.info("📉 Phase 3: Analyse Technique...")
+                top_funds = valid_funds[:10]
+                technicals = technical_analyzer.analyze_batch(
+                    [f.symbol for f in top_funds], executor=self.executor
+                )
+                self._tech_map = {t.symbol: t for t in technicals}
+
+                # Phase 4: Sentiment (top 5 après filtre technique)
+                logger.info("💬 Phase 4: Analyse Sentiment...")
+                # Filtrer: garder seulement ceux au-dessus de MM50
+                bullish_symbols = [t.symbol for t in technicals if t.is_valid and t.above_ma50][:5]
+                sentiments = (
+                    sentiment_analyzer.analyze_multiple(bullish_symbols, executor=self.executor)
+                    if bullish_symbols else []
+                )
+                self._sent_map = {s.symbol: s for s in sentiments}
 
-            # Envoyer debug Telegram pour chaque action analysée (top 10)
-            if self.debug_telegram and not self.test_mode:
-                self._send_debug_analysis(fundamentals[:10], technicals, sentiments)
+                # Envoyer debug Telegram pour chaque action analysée (top 10)
+                if self.debug_telegram and not self.test_mode:
+                    self._send_debug_analysis(top_funds)
 
-            # Phase 5: Signaux
-            logger.info("🎯 Phase 5: Génération Signaux...")
-            signals = self._generate_signals(market, fundamentals, technicals, sentiments)
+                # Phase 5: Signaux
+                logger.info("🎯 Phase 5: Génération Signaux...")
+                signals = self._generate_signals(market, valid_funds)
 
             # Résumé
-            duration = (datetime.now() - start).seconds
+            duration = time.perf_counter() - start
             logger.info("═" * 50)
-            logger.info(f"✅ Terminé en {duration}s - {len(signals)} signaux")
+            logger.info("✅ Terminé en %.1fs - %d signaux", duration, len(signals))
             logger.info("═" * 50)
 
             # Envoi Telegram
-            self._send_summary(market, fundamentals, technicals, sentiments, signals)
+            self._send_summary(market, valid_funds, signals)
 
         except Exception as e:
-            logger.error(f"❌ Erreur: {e}")
+            logger.error("❌ Erreur: %s", e)
             error_msg = str(e)
             if not self.test_mode:
+                if self.startup_banner:
+                    telegram_bot.send_message(self.startup_banner, to_channel=False)
+                    self.startup_banner = None
                 telegram_bot.send_error_alert(error_msg)
 
-        finally:
-            gc.collect()
-
         # Retourner le nombre de signaux (ou -1 si erreur)
         return len(signals) if error_msg is None else -1
 
     def _generate_signals(
         self,
         market: MarketContext,
-        fundamentals: List[FundamentalScore],
-        technicals: List[TechnicalScore],
-        sentiments: List[SentimentScore]
+        fundamentals: List[FundamentalScore]
     ) -> List[SignalRecord]:
-        """Génère les signaux d'achat"""
+        """Génère les signaux d'achat (fundamentals: uniquement les valides)"""
+        from analysis.technical import TechView
+        from data.twelve_data import twelve_data_client
+        from storage.signals_store import signals_store, SignalRecord
+
         signals = []
-        sentiment_map = {s.symbol: s for s in sentiments}
-        technical_map = {t.symbol: t for t in technicals}
+        market_score = market.market_score
 
         # Condition bloquante: si market négatif, pas de signal
-        if market.market_score < 0:
+        if market_score < 0:
             logger.info("   ⛔ Marché défavorable - Pas de signal")
             return signals
 
+        # Score total (0-10), chaque composante normalisée 0-2.5 (poids: 25%)
+        # Market: -1 à +1 → -1→0, 0→1.25, +1→2.5 (identique pour tous les symboles)
+        # Technical / Momentum / Sentiment: 0-3 → 0→0, 3→2.5
+        market_norm = (market_score + 1) * 1.25
+        threshold = config.scoring.alert_threshold
+
+        # Invariants de boucle liés en variables locales (pas de LOAD_ATTR par symbole)
+        tech_view = TechView.from_score
+        get_tech = self._tech_map.get
+        get_sent = self._sent_map.get
+
+        # Passe 1: scoring uniquement (arithmétique scalaire, pas d'objets créés)
+        candidates = []
         for fund in fundamentals:
-            if not fund.is_valid:
+            tech = tech_view(get_tech(fund.symbol))
+
+            # Filtre technique: doit être au-dessus de MM50
+            # Filtre RSI: éviter les surachats (RSI > 70)
+            if tech.valid and (not tech.above_ma50 or tech.rsi_signal == "OVERBOUGHT"):
                 continue
+            tech_score = tech.score
 
-            tech = technical_map.get(fund.symbol)
-            sent = sentiment_map.get(fund.symbol)
+            sent = get_sent(fund.symbol)
+            sent_score = sent.total_score if sent else 1.5
 
-            # Filtre technique: doit être au-dessus de MM50
-            if tech and tech.is_valid and not tech.above_ma50:
-                continue  # Skip si sous MM50
+            # Même facteur 2.5/3 pour les trois composantes: une seule normalisation
+            score = market_norm + (tech_score + fund.total_score + sent_score) * 2.5 / 3
+            if score >= threshold:
+                candidates.append((fund, tech, sent, score, tech_score, sent_score))
 
-            # Filtre RSI: éviter les surachats
-            if tech and tech.is_valid and tech.rsi_signal == "OVERBOUGHT":
-                continue  # Skip si RSI > 70
+        # Prix manquants (pas d'analyse technique): caches de get_quote,
+        # puis requêtes /quote groupées (voir TwelveDataClient.get_prices)
+        missing = [c[0].symbol for c in candidates if not c[1].price]
+        prices = twelve_data_client.get_prices(missing) if missing else {}
 
-            tech_score = tech.total_score if (tech and tech.is_valid) else 1.5
-            sent_score = sent.total_score if sent else 1.5
+        # Passe 2: construction des signaux pour les seuls candidats retenus
+        for fund, tech, sent, score, tech_score, sent_score in candidates:
+            # Récupérer prix actuel (déjà dans tech si disponible)
+            price = tech.price
+            if not price:
+                price = prices.get(fund.symbol)
 
-            # Score total (0-10)
-            # Market: -1 à +1 → normalisé 0-2.5 (poids: 25%)
-            # Technical: 0-3 → normalisé 0-2.5 (poids: 25%)
-            # Momentum: 0-3 → normalisé 0-2.5 (poids: 25%)
-            # Sentiment: 0-3 → normalisé 0-2.5 (poids: 25%)
-            market_norm = (market.market_score + 1) * 1.25  # -1→0, 0→1.25, +1→2.5
-            tech_norm = (tech_score / 3) * 2.5  # 0→0, 3→2.5
-            fund_norm = (fund.total_score / 3) * 2.5  # 0→0, 3→2.5
-            sent_norm = (sent_score / 3) * 2.5  # 0→0, 3→2.5
-
-            # Score brut: 0 à 10
-            score = market_norm + tech_norm + fund_norm + sent_norm
-
-            if score >= config.scoring.alert_threshold:
-                # Récupérer prix actuel (déjà dans tech si disponible)
-                price = tech.price if (tech and tech.is_valid) else None
-                if not price:
-                    quote = twelve_data_client.get_quote(fund.symbol)
-                    price = quote.price if quote.is_valid else None
-
-                # Calculer confiance globale
-                confidence = self._calculate_confidence(market, fund, tech, sent)
-
-                signal = SignalRecord(
-                    symbol=fund.symbol,
-                    total_score=score,
-                    confidence=confidence,
-                    scores={
-                        "market": market.market_score,
-                        "technical": tech_score,
-                        "momentum": fund.total_score,
-                        "sentiment": sent_score
-                    },
-                    price_at_signal=price
-                )
-                signals.append(signal)
-                signals_store.save_signal(signal)
+            # Calculer confiance globale
+            confidence = self._calculate_confidence(market, fund, tech, sent)
+
+            signal = SignalRecord(
+                symbol=fund.symbol,
+                total_score=score,
+                confidence=confidence,
+                scores={
+                    "market": market_score,
+                    "technical": tech_score,
+                    "momentum": fund.total_score,
+                    "sentiment": sent_score
+                },
+                price_at_signal=price
+            )
+            signals.append(signal)
 
-                # Log avec détails techniques
-                ma_info = f"MA50:{tech.ma50_distance:+.0f}%" if (tech and tech.is_valid) else ""
-                rsi_info = f"RSI:{tech.rsi:.0f}" if (tech and tech.is_valid and tech.rsi) else ""
-                logger.info(f"   🚨 SIGNAL: {fund.symbol} ({score:.1f}/10, {ma_info} {rsi_info})")
+            # Log avec détails techniques
+            if logger.isEnabledFor(logging.INFO):
+                ma_info = f"MA50:{tech.ma50_distance:+.0f}%" if tech.valid else ""
+                rsi_info = f"RSI:{tech.rsi:.0f}" if tech.rsi else ""
+                logger.info("   🚨 SIGNAL: %s (%.1f/10, %s %s)", fund.symbol, score, ma_info, rsi_info)
+
+        if signals:
+            signals_store.save_signals(signals)
 
         return signals
 
@@ -310,7 +453,7 @@ class PiTrader:
         self,
         market: MarketContext,
         fund: FundamentalScore,
-        tech: Optional[TechnicalScore],
+        tech: TechView,
         sent: Optional[SentimentScore]
     ) -> float:
         """
@@ -328,10 +471,7 @@ class PiTrader:
             factors.append(0.25)
         if fund.is_valid:
             factors.append(0.25)
-        if tech and tech.is_valid:
-            factors.append(0.25)
-        else:
-            factors.append(0.10)
+        factors.append(0.25 if tech.valid else 0.10)
         if sent and sent.is_valid:
             # Pondérer par la confiance Ollama
             factors.append(0.25 * sent.avg_confidence if sent.avg_confidence > 0 else 0.15)
@@ -339,11 +479,11 @@ class PiTrader:
             factors.append(0.10)
 
         # 2. Bonus technique: forte position au-dessus de MM50
-        if tech and tech.is_valid and tech.ma50_distance > 5:
+        if tech.ma50_distance > 5:  # 0.0 si invalide
             factors.append(0.05)
 
         # 3. Bonus technique: RSI en zone idéale (40-60)
-        if tech and tech.is_valid and tech.rsi and 40 <= tech.rsi <= 60:
+        if tech.rsi and 40 <= tech.rsi <= 60:  # None si invalide
             factors.append(0.05)
 
         # 4. Bonus: nombre d'articles analysés (plus = plus confiant)
@@ -360,8 +500,6 @@ class PiTrader:
         self,
         market: MarketContext,
         fundamentals: List[FundamentalScore],
-        technicals: List[TechnicalScore],
-        _sentiments: List[SentimentScore],
         signals: List[SignalRecord]
     ):
         """Envoie résumé Telegram"""
@@ -369,59 +507,67 @@ class PiTrader:
             logger.info("[TEST] Message Telegram non envoyé")
             return
 
-        technical_map = {t.symbol: t for t in technicals}
+        from telegram import telegram_bot
 
-        # Construire message
-        lines = ["📊 <b>PiTrader - Résumé</b>\n"]
-
-        # Contexte marché
         market_emoji = "🟢" if market.market_score > 0 else "🔴" if market.market_score < 0 else "⚪"
-        lines.append(f"{market_emoji} Marché: {market.market_score:+d} ({market.recommendation})\n")
-
-        # Top 3 momentum + technique
-        lines.append("<b>Top Actions:</b>")
-        for f in fundamentals[:3]:
-            if f.is_valid:
-                tech = technical_map.get(f.symbol)
-                emoji = "🟢" if f.momentum > 0.1 else "🔴" if f.momentum < -0.1 else "⚪"
-                tech_info = ""
-                if tech and tech.is_valid:
-                    ma_emoji = "📈" if tech.above_ma50 else "📉"
-                    tech_info = f" {ma_emoji}MM50:{tech.ma50_distance:+.0f}%"
-                lines.append(f"  {emoji} {f.symbol}: {f.momentum:+.0%}{tech_info}")
+
+        # Construire message (une seule jointure finale)
+        lines = [
+            "📊 <b>PiTrader - Résumé</b>\n",
+            f"{market_emoji} Marché: {market.market_score:+d} ({market.recommendation})\n",
+            "<b>Top Actions:</b>",
+        ]
+
+        # Top 3 momentum + technique (fundamentals: déjà filtrées is_valid)
+        lines.extend(map(self._format_top_row, fundamentals[:3]))
 
         # Signaux
         if signals:
             lines.append("\n<b>🚨 Signaux:</b>")
-            for s in signals:
-                tech = technical_map.get(s.symbol)
-                rsi_info = f" RSI:{tech.rsi:.0f}" if (tech and tech.rsi) else ""
-                lines.append(f"  • {s.symbol}: {s.total_score:.1f}/10{rsi_info}")
+            lines.extend(map(self._format_signal_row, signals))
         else:
             lines.append("\n<i>Pas de signal aujourd'hui</i>")
 
         message = "\n".join(lines)
         # Résumé au DM, pas au channel
-        telegram_bot.send_message(message, to_channel=False)
+        if self.startup_banner:
+            telegram_bot.send_batch([self.startup_banner, message], to_channel=False)
+            self.startup_banner = None
+        else:
+            telegram_bot.send_message(message, to_channel=False)
+
+    def _format_top_row(self, f: FundamentalScore) -> str:
+        """Ligne 'Top Actions' du résumé"""
+        tech = self._tech_map.get(f.symbol)
+        emoji = "🟢" if f.momentum > 0.1 else "🔴" if f.momentum < -0.1 else "⚪"
+        tech_info = ""
+        if tech and tech.is_valid:
+            ma_emoji = "📈" if tech.above_ma50 else "📉"
+            tech_info = f" {ma_emoji}MM50:{tech.ma50_distance:+.0f}%"
+        return f"  {emoji} {f.symbol}: {f.momentum:+.0%}{tech_info}"
+
+    def _format_signal_row(self, s: SignalRecord) -> str:
+        """Ligne 'Signaux' du résumé"""
+        tech = self._tech_map.get(s.symbol)
+        rsi_info = f" RSI:{tech.rsi:.0f}" if (tech and tech.rsi) else ""
+        return f"  • {s.symbol}: {s.total_score:.1f}/10{rsi_info}"
 
     def _send_debug_analysis(
         self,
-        fundamentals: List[FundamentalScore],
-        technicals: List[TechnicalScore],
-        sentiments: List[SentimentScore]
+        fundamentals: List[FundamentalScore]
     ):
         """Envoie les détails de chaque action analysée au bot (DM)"""
-        technical_map = {t.symbol: t for t in technicals}
-        sentiment_map = {s.symbol: s for s in sentiments}
+        from telegram import telegram_bot
 
-        for fund in fundamentals:
-            if not fund.is_valid:
-                continue
+        technical_map = self._tech_map
+        sentiment_map = self._sent_map
 
+        rows = []
+        for fund in fundamentals:
             tech = technical_map.get(fund.symbol)
             sent = sentiment_map.get(fund.symbol)
 
-            telegram_bot.send_debug_stock_analysis(
+            rows.append(dict(
                 symbol=fund.symbol,
                 momentum=fund.momentum * 100,  # Convertir en %
                 ma50_distance=tech.ma50_distance if (tech and tech.is_valid) else None,
@@ -432,7 +578,10 @@ class PiTrader:
                 neutral_count=sent.neutral_count if sent else 0,
                 sentiment_score=sent.total_score if sent else 0.0,
                 sentiment_confidence=sent.avg_confidence if sent else 0.0
-            )
+            ))
+
+        # Un seul message (découpé si > 4096 caractères) au lieu d'un par action
+        telegram_bot.send_debug_batch(rows)
 
 
 def main():
@@ -444,9 +593,25 @@ def main():
     parser.add_argument("--validate-llm", action="store_true", help="Valide la qualité du LLM")
     parser.add_argument("--llm-debug", action="store_true", help="Active les logs détaillés LLM")
     parser.add_argument("--debug-telegram", action="store_true", help="Envoie détails de chaque action au bot (DM)")
+    parser.add_argument(
+        "--log-level", default="INFO", type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Niveau de log (défaut: INFO)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Threads pour les requêtes API en parallèle (défaut: {DEFAULT_WORKERS})"
+    )
     args = parser.parse_args()
 
-    trader = PiTrader(test_mode=args.test, debug_telegram=args.debug_telegram)
+    root_logger.setLevel(args.log_level)
+    MemoryMonitor.tune_gc()
+
+    trader = PiTrader(
+        test_mode=args.test,
+        debug_telegram=args.debug_telegram,
+        workers=args.workers
+    )
 
     # Health check
     if args.health:
@@ -454,9 +619,11 @@ def main():
         logger.info("🏥 Health Check:")
         for service, ok in status.items():
             emoji = "✅" if ok else "❌"
-            logger.info(f"   {emoji} {service}")
+            logger.info("   %s %s", emoji, service)
         return
 
+    from data.ollama_client import ollama_client
+
     # Validation LLM
     if args.validate_llm:
         logger.info("🧪 Validation LLM...")
@@ -465,17 +632,21 @@ def main():
             return
 
         result = ollama_client.validate_llm_quality()
-        logger.info(f"📊 Résultat: {result['score']} - {result['status']}")
+        logger.info("📊 Résultat: %s - %s", result['score'], result['status'])
 
         for detail in result['details']:
             emoji = "✅" if detail['correct'] else "❌"
             logger.info(
-                f"   {emoji} {detail['text']}\n"
-                f"      Attendu: {detail['expected']}, Obtenu: {detail['got']} "
-                f"(conf: {detail['confidence']:.2f})"
+                "   %s %s\n      Attendu: %s, Obtenu: %s (conf: %.2f)",
+                emoji, detail['text'], detail['expected'], detail['got'], detail['confidence']
             )
         return
 
+    # Cycle complet: charger tout le pipeline maintenant (gelé par gc.freeze)
+    from telegram import telegram_bot
+    for module in _PIPELINE_MODULES:
+        importlib.import_module(module)
+
     # Mode debug LLM
     if args.llm_debug:
         ollama_client.debug_mode = True
@@ -484,24 +655,42 @@ def main():
     # Warmup Ollama au démarrage (attend indéfiniment qu'Ollama soit prêt)
     trader.warmup()
 
+    # Objets de démarrage (modules, config, clients) déplacés en génération
+    # permanente: les collectes suivantes ne les parcourent plus
+    MemoryMonitor.freeze_startup()
+
     # Notification Telegram de démarrage (Ollama est forcément prêt ici)
+    # Jointe au premier résumé pour n'envoyer qu'un seul message
     if not args.test:
-        logger.info("📱 Envoi notification de démarrage...")
-        telegram_bot.send_startup_notification(
+        # Envois Telegram en arrière-plan: l'analyse n'attend plus le réseau
+        telegram_bot.start_background()
+        logger.info("📱 Notification de démarrage jointe au premier résumé")
+        trader.startup_banner = telegram_bot.format_startup_notification(
             watchlist_count=len(config.watchlist),
-            ollama_available=True
+            ollama_available=True,
+            in_progress=False
         )
 
     # Exécution
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     if args.loop:
-        logger.info(f"Mode boucle - intervalle: {args.interval}s")
+        logger.info("Mode boucle - intervalle: %ds", args.interval)
+        # Échéances monotones: la durée de l'analyse est déduite de la pause
+        next_deadline = time.monotonic() + args.interval
+        cycles = 0
         while True:
             try:
                 trader.run_full_analysis()
-                logger.info(f"💤 Pause {args.interval}s...")
-                time.sleep(args.interval)
+                cycles += 1
+                # Pas de collecte périodique si la pression mémoire en a déjà déclenché une
+                if not MemoryMonitor.check_and_cleanup() and cycles % GC_EVERY_N_CYCLES == 0:
+                    gc.collect(1)
+                sleep_for = max(0.0, next_deadline - time.monotonic())
+                logger.info("💤 Pause %.0fs...", sleep_for)
+                time.sleep(sleep_for)
+                # Pas de rattrapage en rafale si une analyse a dépassé l'intervalle
+                next_deadline = max(next_deadline, time.monotonic()) + args.interval
             except KeyboardInterrupt:
                 logger.info("Arrêt demandé")
                 break
@@ -510,7 +699,7 @@ def main():
 
         # Notification Telegram de fin
         if not args.test:
-            duration = int(time.time() - start_time)
+            duration = int(time.perf_counter() - start_time)
             if signals_count >= 0:
                 telegram_bot.send_completion_notification(signals_count, duration)
             else:
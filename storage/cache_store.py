@@ -7,14 +7,20 @@ Léger et sans dépendance (pas de SQLite).
 Caractéristiques:
 - Sauvegarde/lecture fichiers JSON
 - Nettoyage automatique fichiers expirés
-- Thread-safe avec locks
+- Écritures atomiques (fichier temporaire + os.replace)
+- Thread-safe: lectures sans verrou, verrou pour les opérations globales
+- Sérialisation msgpack si disponible (fallback JSON compact, orjson/json)
+- Couche LRU en mémoire devant le disque pour les clés chaudes
+  (enregistrements sérialisés: chaque get() rend une copie, comme le disque)
 """
-import json
 import os
+import re
 import time
+import uuid
 import threading
 import logging
-from typing import Optional, Any, Dict
+from functools import lru_cache
+from typing import Optional, Any, Dict, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -22,9 +28,20 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import config
+from utils.serialization import pack_record, unpack_record
 
 logger = logging.getLogger(__name__)
 
+# Caractères interdits dans un nom de fichier cache
+# (\w == str.isalnum() + '_', comme l'ancienne compréhension caractère par caractère)
+_UNSAFE_CHARS = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_key(key: str) -> str:
+    """Nom de fichier valide pour une clé (mémoïsé: mêmes symboles à chaque cycle)"""
+    return _UNSAFE_CHARS.sub("_", key)
+
 
 class CacheStore:
     """
@@ -34,16 +51,42 @@ class CacheStore:
     Adapté pour Raspberry Pi (pas de base de données lourde).
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None, memory_size: int = 256):
+        """
+        Args:
+            cache_dir: Répertoire des fichiers cache
+            memory_size: Entrées gardées en mémoire (0 = désactivé)
+        """
         self.cache_dir = cache_dir or config.cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        # LRU en mémoire: clé -> (enregistrement sérialisé, _cached_at),
+        # dict ordonné (3.7+): la fin du dict est l'entrée la plus récente.
+        # Octets plutôt que l'objet: un appelant qui modifie la valeur
+        # rendue ne modifie pas le cache (économise l'I/O, pas le décodage)
+        self._memory: Dict[str, Tuple[bytes, float]] = {}
+        self._memory_size = memory_size
+
+    def _remember(self, key: str, blob: bytes, cached_at: float):
+        """Insère dans la LRU mémoire (sans écraser une version plus récente)"""
+        if self._memory_size <= 0:
+            return
+        with self._lock:
+            current = self._memory.get(key)
+            if current is not None and current[1] > cached_at:
+                return  # Lecture disque concurrente d'un set() plus récent
+            # pop + réinsertion: repasse en fin (most recently used)
+            self._memory.pop(key, None)
+            self._memory[key] = (blob, cached_at)
+            while len(self._memory) > self._memory_size:
+                del self._memory[next(iter(self._memory))]
 
     def _get_path(self, key: str) -> Path:
-        """Génère le chemin du fichier cache"""
-        # Sanitize key pour nom de fichier valide
-        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
-        return self.cache_dir / f"{safe_key}.json"
+        """Génère le chemin du fichier cache
+
+        Extension .json conservée quel que soit le format (détecté à la lecture)
+        """
+        return self.cache_dir / f"{_sanitize_key(key)}.json"
 
     def get(self, key: str, default: Any = None, ttl: Optional[int] = None) -> Any:
         """
@@ -57,29 +100,44 @@ class CacheStore:
         Returns:
             Valeur ou default
         """
-        path = self._get_path(key)
-
         with self._lock:
-            if not path.exists():
+            hit = self._memory.pop(key, None)
+            if hit is not None:
+                self._memory[key] = hit
+
+        if hit is not None:
+            blob, cached_at = hit
+            if ttl is not None and time.time() - cached_at > ttl:
+                self.delete(key)
                 return default
+            return unpack_record(blob)["value"]
 
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-
-                # Vérifier expiration si TTL spécifié
-                if ttl is not None:
-                    cached_at = data.get("_cached_at", 0)
-                    if time.time() - cached_at > ttl:
-                        # Expiré, supprimer et retourner default
-                        path.unlink()
-                        return default
+        path = self._get_path(key)
 
-                return data.get("value", default)
+        # Sans verrou: set() remplace le fichier atomiquement, un lecteur voit
+        # l'ancienne ou la nouvelle version, jamais un fichier partiel.
+        # EAFP: un seul open() au lieu de exists() + open()
+        try:
+            blob = path.read_bytes()
+            data = unpack_record(blob)
+
+            # Vérifier expiration si TTL spécifié
+            cached_at = data.get("_cached_at", 0)
+            if ttl is not None and time.time() - cached_at > ttl:
+                # Expiré, supprimer et retourner default
+                path.unlink(missing_ok=True)
+                return default
 
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to read cache {key}: {e}")
+            if "value" not in data:
                 return default
+            self._remember(key, blob, cached_at)
+            return data["value"]
+
+        except FileNotFoundError:
+            return default
+        except (ValueError, IOError) as e:
+            logger.warning(f"Failed to read cache {key}: {e}")
+            return default
 
     def set(self, key: str, value: Any) -> bool:
         """
@@ -87,29 +145,39 @@ class CacheStore:
 
         Args:
             key: Clé de cache
-            value: Valeur à stocker (doit être JSON-serializable)
+            value: Valeur à stocker (types JSON: dict, list, str, nombres...)
 
         Returns:
             True si succès
         """
         path = self._get_path(key)
-
-        with self._lock:
-            try:
-                data = {
-                    "value": value,
-                    "_cached_at": time.time(),
-                    "_key": key
-                }
-
-                with open(path, "w") as f:
-                    json.dump(data, f, indent=2, default=str)
-
-                return True
-
-            except (TypeError, IOError) as e:
-                logger.error(f"Failed to write cache {key}: {e}")
-                return False
+        # Fichier temporaire unique par écriture: pas de verrou entre écrivains,
+        # le dernier os.replace() gagne
+        tmp = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            now = time.time()
+            data = {
+                "value": value,
+                "_cached_at": now,
+                "_key": key
+            }
+
+            # msgpack (ou JSON compact): moins d'octets écrits sur la SD
+            blob = pack_record(data)
+            tmp.write_bytes(blob)
+            # mtime == _cached_at: cleanup_expired se contente d'un stat
+            os.utime(tmp, (now, now))
+            # Remplacement atomique (POSIX): pas de fichier tronqué après coupure
+            os.replace(tmp, path)
+
+            self._remember(key, blob, now)
+            return True
+
+        except (TypeError, IOError) as e:
+            logger.error(f"Failed to write cache {key}: {e}")
+            tmp.unlink(missing_ok=True)
+            return False
 
     def delete(self, key: str) -> bool:
         """
@@ -124,10 +192,12 @@ class CacheStore:
         path = self._get_path(key)
 
         with self._lock:
-            if path.exists():
+            self._memory.pop(key, None)
+            try:
                 path.unlink()
                 return True
-            return False
+            except FileNotFoundError:
+                return False
 
     def exists(self, key: str) -> bool:
         """Vérifie si une clé existe"""
@@ -142,12 +212,16 @@ class CacheStore:
         """
         count = 0
         with self._lock:
-            for path in self.cache_dir.glob("*.json"):
-                try:
-                    path.unlink()
-                    count += 1
-                except IOError:
-                    pass
+            self._memory.clear()
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except IOError:
+                        pass
         return count
 
     def cleanup_expired(self, ttl: int) -> int:
@@ -163,24 +237,22 @@ class CacheStore:
         count = 0
         now = time.time()
 
-        with self._lock:
-            for path in self.cache_dir.glob("*.json"):
-                try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
+        # mtime du fichier == _cached_at (garanti par set): pas de lecture JSON
+        with self._lock, os.scandir(self.cache_dir) as it:
+            expired = [k for k, (_, ts) in self._memory.items() if now - ts > ttl]
+            for key in expired:
+                del self._memory[key]
 
-                    cached_at = data.get("_cached_at", 0)
-                    if now - cached_at > ttl:
-                        path.unlink()
-                        count += 1
-
-                except (json.JSONDecodeError, IOError):
-                    # Fichier corrompu, supprimer
-                    try:
-                        path.unlink()
+            for entry in it:
+                # .tmp: écriture interrompue (coupure courant) à purger aussi
+                if not entry.name.endswith((".json", ".tmp")):
+                    continue
+                try:
+                    if now - entry.stat().st_mtime > ttl:
+                        os.unlink(entry.path)
                         count += 1
-                    except IOError:
-                        pass
+                except FileNotFoundError:
+                    pass
 
         logger.info(f"Cleaned up {count} expired cache files")
         return count
@@ -188,22 +260,35 @@ class CacheStore:
     def list_keys(self) -> list:
         """Liste toutes les clés en cache"""
         keys = []
-        for path in self.cache_dir.glob("*.json"):
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-                    keys.append(data.get("_key", path.stem))
-            except (json.JSONDecodeError, IOError):
-                pass
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = unpack_record(f.read())
+                    keys.append(data.get("_key", entry.name[:-5]))
+                except (ValueError, IOError):
+                    pass
         return keys
 
     def get_stats(self) -> Dict[str, Any]:
         """Statistiques du cache"""
-        files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
+        entries = 0
+        total_size = 0
+        # Un seul parcours du répertoire, DirEntry sans objets Path
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    total_size += entry.stat().st_size
+                    entries += 1
+                except FileNotFoundError:
+                    pass  # Supprimé entre-temps (cleanup concurrent)
 
         return {
-            "entries": len(files),
+            "entries": entries,
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
             "cache_dir": str(self.cache_dir)
@@ -13,25 +13,92 @@ Workflow:
 3. Utilisateur note -> rate_signal()
 4. J+7 -> update_performance() automatique
 5. Export -> export_csv() pour analyse
+
+Index: _index.json résume chaque signal (date, symbole, note, performance).
+Les requêtes filtrent sur l'index et n'ouvrent que les fichiers retenus.
+Les fichiers signaux restent la référence: index absent/corrompu -> reconstruit.
+Les mises à jour de l'index sont ajoutées à un journal (_index.log), fusionné
+dans _index.json toutes les JOURNAL_COMPACT_AT lignes.
 """
-import json
+import os
+import mmap
 import uuid
 import logging
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field, asdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Iterable, Set, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import config
 from data.twelve_data import twelve_data_client
+from utils.serialization import dumps, loads, JSONDecodeError, ORJSON_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Fichier d'index (préfixe "_": jamais confondu avec un signal)
+INDEX_FILE = "_index.json"
+INDEX_VERSION = 2  # v2: champ "ts" (epoch) pour les comparaisons de date
+
+# Journal des lignes d'index modifiées depuis la dernière réécriture complète:
+# noter un signal ajoute ~150 octets au lieu de réécrire tout l'index
+INDEX_JOURNAL = "_index.log"
+JOURNAL_COMPACT_AT = 200
+
+# Champs du signal recopiés dans l'index
+_INDEX_FIELDS = ("timestamp", "symbol", "rating", "price_after_7d", "actual_return")
+
+# Lectures de fichiers en parallèle à partir de ce nombre (en dessous,
+# le coût des threads dépasse le gain)
+PARALLEL_LOAD_THRESHOLD = 50
+# Threads créés au premier lot volumineux seulement (4 coeurs sur Pi 5)
+_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="signals-io")
+
+# Signaux chargés à la fois par iter_signals() (mémoire bornée des exports)
+STREAM_CHUNK = 256
+
+# Fichiers lus via mmap à partir de cette taille (en dessous, mettre en place
+# le mapping coûte plus qu'un read())
+MMAP_MIN_SIZE = 4096
+
+
+def _map_files(func, items: List[Any]) -> Iterator[Any]:
+    """map() séquentiel ou sur le pool selon la taille du lot (ordre conservé)"""
+    if len(items) < PARALLEL_LOAD_THRESHOLD:
+        return map(func, items)
+    return _LOAD_EXECUTOR.map(func, items)
+
+
+def _load_file(path) -> Any:
+    """
+    Désérialise un fichier JSON
+
+    Gros fichiers: orjson parse directement les pages mappées, sans copie
+    intermédiaire (le module json standard exige des bytes: read()).
+    """
+    with open(path, "rb") as f:
+        if not ORJSON_AVAILABLE or os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return loads(view)
+            finally:
+                view.release()  # Sinon mm.close() lève BufferError
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    """Lit un fichier signal (None si illisible)"""
+    try:
+        return _load_file(path)
+    except (JSONDecodeError, IOError, ValueError):
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class SignalRecord:
     """
     Enregistrement complet d'un signal
@@ -74,8 +141,13 @@ class SignalRecord:
     performance_updated_at: Optional[str] = None
 
     def to_dict(self) -> dict:
-        """Convertit en dictionnaire"""
-        return asdict(self)
+        """
+        Convertit en dictionnaire
+
+        Copie superficielle (scores partagé avec l'instance): destinée à la
+        sérialisation, sans la copie récursive de dataclasses.asdict
+        """
+        return {name: getattr(self, name) for name in _SIGNAL_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'SignalRecord':
@@ -83,6 +155,10 @@ class SignalRecord:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
+# Noms des champs, dans l'ordre de déclaration (to_dict)
+_SIGNAL_FIELDS = tuple(f.name for f in fields(SignalRecord))
+
+
 class SignalsStore:
     """
     Gestionnaire des signaux
@@ -91,16 +167,299 @@ class SignalsStore:
     - Simplicité (pas de SQLite)
     - Lisibilité (un fichier par signal)
     - Robustesse (pas de corruption DB)
+
+    Plus un index résumé (_index.json) pour éviter de relire tous les
+    fichiers à chaque requête.
     """
 
     def __init__(self, signals_dir: Optional[Path] = None):
         self.signals_dir = signals_dir or config.signals_dir
         self.signals_dir.mkdir(parents=True, exist_ok=True)
+        # Signaux en attente pendant un bloc batch() (None = écriture immédiate)
+        self._pending: Optional[List[SignalRecord]] = None
+        # Index id -> champs résumés (chargé au premier accès)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        # (mtime index, taille journal) au dernier chargement/écriture
+        self._index_stamp: Optional[Tuple[Optional[int], int]] = None
+        self._journal_len = 0
+        self._lock = threading.Lock()
+        # Sous-ensembles de l'index pour /review et le cron J+7
+        self._unrated_ids: Set[str] = set()
+        self._needs_perf_ids: Set[str] = set()
+        # IDs par symbole (le symbole d'un signal ne change jamais)
+        self._by_symbol: Dict[str, Set[str]] = {}
+        # Résultats dérivés de l'index, invalidés à chaque changement d'index
+        # (stats + exports enchaînés: une seule lecture des fichiers)
+        self._all_cache: Optional[List[SignalRecord]] = None
+        self._stats_cache: Optional[Dict[str, Any]] = None
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+
+    @property
+    def _index_path(self) -> Path:
+        return self.signals_dir / INDEX_FILE
+
+    @property
+    def _journal_path(self) -> Path:
+        return self.signals_dir / INDEX_JOURNAL
+
+    def _stat_stamp(self) -> Tuple[Optional[int], int]:
+        """Empreinte (mtime index, taille journal): détecte un autre process"""
+        try:
+            mtime = self._index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        try:
+            journal_size = self._journal_path.stat().st_size
+        except FileNotFoundError:
+            journal_size = 0
+        return mtime, journal_size
+
+    @staticmethod
+    def _index_row(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extrait les champs indexés d'un signal (dict)"""
+        row = {k: data.get(k) for k in _INDEX_FIELDS}
+        # Date parsée une fois à l'indexation: tris et seuils = comparaisons de float
+        try:
+            row["ts"] = datetime.fromisoformat(row["timestamp"]).timestamp()
+        except (TypeError, ValueError):
+            row["ts"] = None
+        return row
+
+    def _signal_files(self) -> List[str]:
+        """Chemins de tous les fichiers signaux (hors index)"""
+        with os.scandir(self.signals_dir) as it:
+            return [
+                entry.path for entry in it
+                if entry.name.endswith(".json") and not entry.name.startswith("_")
+            ]
+
+    def _rebuild_index(self) -> Dict[str, Dict[str, Any]]:
+        """Reconstruit l'index en relisant tous les fichiers signaux"""
+        index = {}
+        for data in _map_files(_read_json, self._signal_files()):
+            try:
+                index[data["id"]] = self._index_row(data)
+            except (KeyError, TypeError):
+                continue
+
+        logger.info(f"Rebuilt signals index ({len(index)} signals)")
+        return index
+
+    def _track(self, signal_id: str, row: Dict[str, Any]):
+        """Range un signal dans les sous-ensembles unrated / needs-perf / symbole"""
+        symbol = row.get("symbol")
+        if symbol:
+            self._by_symbol.setdefault(symbol, set()).add(signal_id)
+
+        if row.get("rating") is None:
+            self._unrated_ids.add(signal_id)
+        else:
+            self._unrated_ids.discard(signal_id)
+
+        if row.get("price_after_7d") is None:
+            self._needs_perf_ids.add(signal_id)
+        else:
+            self._needs_perf_ids.discard(signal_id)
+
+    def _set_index(self, index: Dict[str, Dict[str, Any]]):
+        """Remplace l'index et recalcule les sous-ensembles (sous self._lock)"""
+        self._index = index
+        self._unrated_ids = set()
+        self._needs_perf_ids = set()
+        self._by_symbol = {}
+        for signal_id, row in index.items():
+            self._track(signal_id, row)
+
+    def _write_index(self):
+        """Écrit l'index complet atomiquement et vide le journal (sous self._lock)"""
+        self._all_cache = self._stats_cache = None
+        path = self._index_path
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(dumps({"version": INDEX_VERSION, "signals": self._index}))
+            os.replace(tmp, path)
+            # Après le replace: une coupure entre les deux rejoue un journal
+            # déjà intégré, sans effet (lignes complètes, la dernière gagne)
+            self._journal_path.unlink(missing_ok=True)
+            self._journal_len = 0
+            self._index_stamp = self._stat_stamp()
+        except IOError as e:
+            # Non bloquant: l'index sera reconstruit au prochain démarrage
+            logger.warning(f"Failed to write signals index: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _append_journal(self, rows: List[Tuple[str, Dict[str, Any]]]):
+        """Ajoute des lignes d'index au journal (sous self._lock)"""
+        # "\n" initial: isole une éventuelle ligne tronquée laissée par une coupure
+        data = b"\n" + b"".join(dumps({"id": signal_id, **row}) + b"\n" for signal_id, row in rows)
+        try:
+            fd = os.open(self._journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            self._journal_len += len(rows)
+            self._index_stamp = self._stat_stamp()
+        except OSError as e:
+            logger.warning(f"Failed to append signals index journal: {e}")
+            self._write_index()
+
+    def _replay_journal(self, index: Dict[str, Dict[str, Any]]) -> int:
+        """Applique le journal à l'index chargé, retourne le nombre de lignes"""
+        try:
+            lines = self._journal_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return 0
+
+        count = 0
+        for line in lines:
+            if not line:
+                continue
+            try:
+                row = loads(line)
+                index[row.pop("id")] = row
+                count += 1
+            except (JSONDecodeError, KeyError, AttributeError):
+                continue  # Dernière ligne tronquée (coupure pendant l'ajout)
+        return count
+
+    def _get_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Index courant
+
+        Rechargé si _index.json ou son journal ont été modifiés par un
+        autre process, reconstruit si l'index est absent ou illisible.
+        """
+        with self._lock:
+            stamp = self._stat_stamp()
+            mtime = stamp[0]
+
+            if self._index is not None and stamp == self._index_stamp:
+                return self._index
+
+            # Index modifié ailleurs: les résultats dérivés sont périmés
+            self._all_cache = self._stats_cache = None
+            index = None
+            if mtime is not None:
+                try:
+                    data = loads(self._index_path.read_bytes())
+                    if data.get("version") == INDEX_VERSION:
+                        index = data["signals"]
+                        self._journal_len = self._replay_journal(index)
+                        self._index_stamp = stamp
+                except (JSONDecodeError, IOError, KeyError, AttributeError) as e:
+                    logger.warning(f"Signals index unreadable, rebuilding: {e}")
+
+            if index is None:
+                self._set_index(self._rebuild_index())
+                self._write_index()
+            else:
+                self._set_index(index)
+            return self._index
+
+    def _index_signals(self, signals: List[SignalRecord]):
+        """Met à jour l'index pour des signaux venant d'être écrits"""
+        if not signals:
+            return
+        self._get_index()
+        with self._lock:
+            rows = []
+            for signal in signals:
+                row = self._index_row({k: getattr(signal, k) for k in _INDEX_FIELDS})
+                self._index[signal.id] = row
+                self._track(signal.id, row)
+                rows.append((signal.id, row))
+
+            self._all_cache = self._stats_cache = None
+            if self._journal_len + len(rows) > JOURNAL_COMPACT_AT:
+                self._write_index()
+            else:
+                self._append_journal(rows)
+
+    def _ids_by_date(self, ids: Optional[Iterable[str]] = None) -> List[str]:
+        """IDs triés par date décroissante (tous, ou seulement ceux donnés)"""
+        index = self._get_index()
+        if ids is None:
+            ids = index.keys()
+        return sorted(ids, key=lambda sid: index[sid].get("ts") or 0.0, reverse=True)
+
+    def _load_signals(self, ids: List[str], limit: int) -> List[SignalRecord]:
+        """Charge les fichiers des IDs donnés (fichiers manquants ignorés)"""
+        signals = []
+        start = 0
+        # Par tranches: un fichier manquant est remplacé par l'ID suivant
+        while len(signals) < limit and start < len(ids):
+            chunk = ids[start:start + limit - len(signals)]
+            start += len(chunk)
+            signals.extend(s for s in _map_files(self.get_signal, chunk) if s is not None)
+        return signals
+
+    def rebuild_index(self) -> int:
+        """
+        Force la reconstruction de l'index depuis les fichiers
+
+        Returns:
+            Nombre de signaux indexés
+        """
+        with self._lock:
+            self._set_index(self._rebuild_index())
+            self._write_index()
+            return len(self._index)
+
+    # =========================================================================
+    # ÉCRITURE / LECTURE
+    # =========================================================================
+
+    @contextmanager
+    def batch(self) -> Iterator['SignalsStore']:
+        """
+        Regroupe les save_signal() d'un bloc en une seule écriture à la sortie
+
+        Les signaux en attente ne sont visibles par get_signal() qu'après
+        la sortie du bloc.
+
+        Utilisation:
+            with signals_store.batch():
+                for signal_id in ids:
+                    signals_store.update_performance(signal_id)
+        """
+        if self._pending is not None:
+            # Bloc imbriqué: le bloc englobant s'occupe de l'écriture
+            yield self
+            return
+
+        self._pending = []
+        try:
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self.save_signals(pending)
 
     def _get_path(self, signal_id: str) -> Path:
         """Chemin du fichier signal"""
         return self.signals_dir / f"{signal_id}.json"
 
+    def _write_signal(self, signal: SignalRecord):
+        """
+        Écrit le fichier d'un signal
+
+        JSON compact (~40% d'octets en moins qu'indenté) et remplacement
+        atomique: une coupure de courant pendant rate_signal() ou
+        update_performance() ne laisse jamais un fichier tronqué.
+        """
+        path = self._get_path(signal.id)
+        tmp = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(dumps(signal.to_dict()))
+            os.replace(tmp, path)
+        except (IOError, TypeError):
+            tmp.unlink(missing_ok=True)
+            raise
+
     def save_signal(self, signal: SignalRecord) -> str:
         """
         Sauvegarde un nouveau signal
@@ -111,11 +470,13 @@ class SignalsStore:
         Returns:
             ID du signal
         """
-        path = self._get_path(signal.id)
+        if self._pending is not None:
+            self._pending.append(signal)
+            return signal.id
 
         try:
-            with open(path, "w") as f:
-                json.dump(signal.to_dict(), f, indent=2, default=str)
+            self._write_signal(signal)
+            self._index_signals([signal])
 
             logger.info(f"Saved signal {signal.id} for {signal.symbol}")
             return signal.id
@@ -124,6 +485,36 @@ class SignalsStore:
             logger.error(f"Failed to save signal: {e}")
             raise
 
+    def save_signals(self, signals: List[SignalRecord]) -> List[str]:
+        """
+        Sauvegarde plusieurs signaux en une passe
+
+        Un seul log récapitulatif au lieu d'un par signal. Un échec
+        d'écriture n'interrompt pas les suivants.
+
+        Args:
+            signals: SignalRecords à sauvegarder
+
+        Returns:
+            IDs des signaux effectivement sauvegardés
+        """
+        saved = []
+
+        for signal in signals:
+            try:
+                self._write_signal(signal)
+                saved.append(signal)
+            except IOError as e:
+                logger.error(f"Failed to save signal {signal.id} ({signal.symbol}): {e}")
+
+        # Une seule réécriture de l'index pour tout le lot
+        self._index_signals(saved)
+        saved = [signal.id for signal in saved]
+
+        if saved:
+            logger.info(f"Saved {len(saved)}/{len(signals)} signals")
+        return saved
+
     def get_signal(self, signal_id: str) -> Optional[SignalRecord]:
         """
         Récupère un signal par son ID
@@ -136,15 +527,13 @@ class SignalsStore:
         """
         path = self._get_path(signal_id)
 
-        if not path.exists():
-            return None
-
+        # EAFP + orjson sur les bytes: un seul open(), pas de décodage texte
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            return SignalRecord.from_dict(data)
+            return SignalRecord.from_dict(_load_file(path))
 
-        except (json.JSONDecodeError, IOError) as e:
+        except FileNotFoundError:
+            return None
+        except (JSONDecodeError, IOError) as e:
             logger.error(f"Failed to read signal {signal_id}: {e}")
             return None
 
@@ -185,23 +574,32 @@ class SignalsStore:
         Returns:
             Liste de SignalRecord non notés
         """
-        unrated = []
-
-        for path in sorted(self.signals_dir.glob("*.json"), reverse=True):
-            if len(unrated) >= limit:
-                break
-
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-
-                if data.get("rating") is None:
-                    unrated.append(SignalRecord.from_dict(data))
+        self._get_index()
+        ids = self._ids_by_date(list(self._unrated_ids))
+        return self._load_signals(ids, limit)
+
+    def get_signals_by_symbol(
+        self,
+        symbol: str,
+        limit: int = 10,
+        unrated_only: bool = False
+    ) -> List[SignalRecord]:
+        """
+        Signaux d'un symbole, du plus récent au plus ancien
 
-            except (json.JSONDecodeError, IOError):
-                continue
+        Args:
+            symbol: Ticker
+            limit: Nombre max de signaux
+            unrated_only: Seulement les signaux non notés
 
-        return unrated
+        Returns:
+            Liste de SignalRecord
+        """
+        self._get_index()
+        ids = self._by_symbol.get(symbol, set())
+        if unrated_only:
+            ids = ids & self._unrated_ids
+        return self._load_signals(self._ids_by_date(list(ids)), limit)
 
     def get_signals_for_performance_update(self, days: int = 7) -> List[SignalRecord]:
         """
@@ -215,27 +613,19 @@ class SignalsStore:
         Returns:
             Liste de SignalRecord à mettre à jour
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        to_update = []
-
-        for path in self.signals_dir.glob("*.json"):
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-
-                # Vérifier si signal assez ancien
-                signal_time = datetime.fromisoformat(data["timestamp"])
-                if signal_time > cutoff:
-                    continue
-
-                # Vérifier si performance pas encore mise à jour
-                if data.get("price_after_7d") is None:
-                    to_update.append(SignalRecord.from_dict(data))
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        ids = []
 
-            except (json.JSONDecodeError, IOError, ValueError):
-                continue
+        # Seulement les signaux sans performance (pas tout l'index)
+        index = self._get_index()
+        for signal_id in list(self._needs_perf_ids):
+            # Vérifier si signal assez ancien (date illisible = ignoré)
+            row = index.get(signal_id)
+            ts = row.get("ts") if row else None
+            if ts is not None and ts <= cutoff:
+                ids.append(signal_id)
 
-        return to_update
+        return self._load_signals(ids, len(ids))
 
     def update_performance(self, signal_id: str) -> bool:
         """
@@ -249,33 +639,59 @@ class SignalsStore:
         Returns:
             True si succès
         """
-        signal = self.get_signal(signal_id)
-        if not signal or signal.price_at_signal is None:
-            return False
+        return bool(self.update_performance_batch([signal_id]))
 
-        try:
-            # Récupérer prix actuel
-            quote = twelve_data_client.get_quote(signal.symbol)
-            if not quote.is_valid or quote.price is None:
-                return False
-
-            signal.price_after_7d = quote.price
-            signal.actual_return = (
-                (quote.price - signal.price_at_signal)
-                / signal.price_at_signal * 100
-            )
-            signal.performance_updated_at = datetime.now().isoformat()
-
-            self.save_signal(signal)
-            logger.info(
-                f"Updated performance for {signal.symbol}: "
-                f"{signal.actual_return:+.2f}%"
-            )
-            return True
+    def update_performance_batch(self, signal_ids: List[str]) -> List[str]:
+        """
+        Met à jour la performance de plusieurs signaux
 
+        Une cotation par symbole distinct, récupérées par requêtes batch
+        (au lieu d'un aller-retour HTTP par signal), et une seule
+        réécriture de l'index.
+
+        Args:
+            signal_ids: IDs des signaux (ex: get_signals_for_performance_update)
+
+        Returns:
+            IDs des signaux effectivement mis à jour
+        """
+        signals = [
+            s for s in self._load_signals(signal_ids, len(signal_ids))
+            if s.price_at_signal is not None
+        ]
+        if not signals:
+            return []
+
+        try:
+            prices = twelve_data_client.get_prices([s.symbol for s in signals])
         except Exception as e:
             logger.error(f"Failed to update performance: {e}")
-            return False
+            return []
+
+        updated = []
+        now = datetime.now().isoformat()
+
+        with self.batch():
+            for signal in signals:
+                price = prices.get(signal.symbol)
+                if price is None:
+                    continue
+
+                signal.price_after_7d = price
+                signal.actual_return = (
+                    (price - signal.price_at_signal)
+                    / signal.price_at_signal * 100
+                )
+                signal.performance_updated_at = now
+
+                self.save_signal(signal)
+                updated.append(signal.id)
+                logger.info(
+                    f"Updated performance for {signal.symbol}: "
+                    f"{signal.actual_return:+.2f}%"
+                )
+
+        return updated
 
     def get_all_signals(self, limit: int = 100) -> List[SignalRecord]:
         """
@@ -287,21 +703,39 @@ class SignalsStore:
         Returns:
             Liste de SignalRecord triée par date décroissante
         """
-        signals = []
-
-        for path in sorted(self.signals_dir.glob("*.json"), reverse=True):
-            if len(signals) >= limit:
-                break
+        ids = self._ids_by_date()
+        cached = self._all_cache
+        if cached is not None and len(cached) >= min(limit, len(ids)):
+            return cached[:limit]
+
+        signals = self._load_signals(ids, limit)
+        self._all_cache = signals
+        return signals[:]
+
+    def iter_signals(
+        self,
+        limit: Optional[int] = None,
+        ids: Optional[Iterable[str]] = None
+    ) -> Iterator[SignalRecord]:
+        """
+        Parcourt les signaux par date décroissante sans tous les garder en mémoire
 
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-                signals.append(SignalRecord.from_dict(data))
+        Args:
+            limit: Nombre max d'IDs parcourus (None = tous)
+            ids: Restreindre à ces IDs (défaut: tout l'index)
 
-            except (json.JSONDecodeError, IOError):
-                continue
+        Yields:
+            SignalRecord (fichiers manquants ignorés)
+        """
+        ids = self._ids_by_date(ids)
+        if limit is not None:
+            ids = ids[:limit]
 
-        return signals
+        # Par tranches: lecture parallèle sans matérialiser tout l'historique
+        for start in range(0, len(ids), STREAM_CHUNK):
+            for signal in _map_files(self.get_signal, ids[start:start + STREAM_CHUNK]):
+                if signal is not None:
+                    yield signal
 
     def export_csv(self, output_path: Optional[Path] = None) -> Path:
         """
@@ -318,9 +752,8 @@ class SignalsStore:
         import csv
 
         output_path = output_path or (self.signals_dir / "signals_export.csv")
-        signals = self.get_all_signals(limit=10000)
 
-        if not signals:
+        if not self._get_index():
             logger.warning("No signals to export")
             return output_path
 
@@ -331,11 +764,14 @@ class SignalsStore:
             "total_score", "rating", "price_after_7d", "actual_return"
         ]
 
+        count = 0
         with open(output_path, "w", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
 
-            for s in signals:
+            # Streaming: une ligne écrite par signal lu
+            for s in self.iter_signals(limit=10000):
+                count += 1
                 row = {
                     "id": s.id,
                     "timestamp": s.timestamp,
@@ -352,7 +788,7 @@ class SignalsStore:
                 }
                 writer.writerow(row)
 
-        logger.info(f"Exported {len(signals)} signals to {output_path}")
+        logger.info(f"Exported {count} signals to {output_path}")
         return output_path
 
     def export_ml_ready(self, output_path: Optional[Path] = None) -> Path:
@@ -375,12 +811,13 @@ class SignalsStore:
         from datetime import datetime as dt
 
         output_path = output_path or (self.signals_dir / "signals_ml.csv")
-        signals = self.get_all_signals(limit=10000)
-
-        # Filtrer: garder uniquement les signaux avec return connu
-        signals_with_outcome = [s for s in signals if s.actual_return is not None]
+        # Filtrer sur l'index: ne lire que les signaux avec return connu
+        outcome_ids = [
+            sid for sid, row in self._get_index().items()
+            if row.get("actual_return") is not None
+        ]
 
-        if not signals_with_outcome:
+        if not outcome_ids:
             logger.warning("No signals with outcomes to export for ML")
             return output_path
 
@@ -414,7 +851,11 @@ class SignalsStore:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
 
-            for s in signals_with_outcome:
+            count = 0
+            for s in self.iter_signals(limit=10000, ids=outcome_ids):
+                if s.actual_return is None:
+                    continue  # Index en retard sur le fichier
+                count += 1
                 # Parser timestamp
                 try:
                     ts = dt.fromisoformat(s.timestamp)
@@ -457,7 +898,7 @@ class SignalsStore:
                 }
                 writer.writerow(row)
 
-        logger.info(f"Exported {len(signals_with_outcome)} ML-ready signals to {output_path}")
+        logger.info(f"Exported {count} ML-ready signals to {output_path}")
         return output_path
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -467,37 +908,51 @@ class SignalsStore:
         Returns:
             Dict avec stats
         """
-        signals = self.get_all_signals(limit=10000)
-
-        if not signals:
+        # Champs nécessaires tous présents dans l'index: aucun fichier ouvert
+        index = self._get_index()
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+        if not index:
             return {"count": 0}
 
-        rated = [s for s in signals if s.rating is not None]
-        with_return = [s for s in signals if s.actual_return is not None]
-
+        # Une seule passe: tous les compteurs accumulés ensemble
+        ratings = Counter()
+        returns_count = positive = negative = 0
+        returns_sum = 0.0
+        for row in index.values():
+            rating = row.get("rating")
+            if rating is not None:
+                ratings[rating] += 1
+            ret = row.get("actual_return")
+            if ret is not None:
+                returns_count += 1
+                returns_sum += ret
+                if ret > 0:
+                    positive += 1
+                elif ret < 0:
+                    negative += 1
+
+        rated_count = sum(ratings.values())
         stats = {
-            "total_count": len(signals),
-            "rated_count": len(rated),
-            "unrated_count": len(signals) - len(rated),
-            "with_return_count": len(with_return)
+            "total_count": len(index),
+            "rated_count": rated_count,
+            "unrated_count": len(index) - rated_count,
+            "with_return_count": returns_count
         }
 
         # Stats par rating
-        if rated:
-            stats["avg_rating"] = sum(s.rating for s in rated) / len(rated)
-            stats["rating_distribution"] = {
-                i: sum(1 for s in rated if s.rating == i)
-                for i in range(1, 6)
-            }
+        if rated_count:
+            stats["avg_rating"] = sum(r * n for r, n in ratings.items()) / rated_count
+            stats["rating_distribution"] = {i: ratings[i] for i in range(1, 6)}
 
         # Stats de performance
-        if with_return:
-            returns = [s.actual_return for s in with_return]
-            stats["avg_return"] = sum(returns) / len(returns)
-            stats["positive_returns"] = sum(1 for r in returns if r > 0)
-            stats["negative_returns"] = sum(1 for r in returns if r < 0)
+        if returns_count:
+            stats["avg_return"] = returns_sum / returns_count
+            stats["positive_returns"] = positive
+            stats["negative_returns"] = negative
 
-        return stats
+        self._stats_cache = stats
+        return dict(stats)
 
 
 # Instance singleton
@@ -8,23 +8,69 @@ Fonctionnalités:
 - Commande /stats pour statistiques
 
 Pas de graphiques (simplifié pour Pi)
+
+Mode arrière-plan (optionnel): start_background() met les envois en file,
+un thread dédié les expédie (l'analyse n'attend plus le réseau).
 """
 import requests
+import os
+import queue
+import atexit
 import logging
+import threading
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from config import config
 from storage.signals_store import signals_store, SignalRecord
 from data.twelve_data import twelve_data_client
-from utils.decorators import retry_with_backoff
+from utils.cache import TTLCache
+from utils.decorators import retry_with_backoff, get_cpu_temperature
+from utils.serialization import dumps, loads
+from utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Prix actuels de /review réutilisés pendant 60s (commandes répétées)
+REVIEW_PRICE_TTL = 60
+
+# Attente max des messages en file à l'arrêt du programme (secondes)
+FLUSH_TIMEOUT = 60
+
+# Gabarits des messages fréquents (format_map sur un dict préparé)
+_SIGNAL_TEMPLATE = (
+    "🚨 <b>SIGNAL ACHAT: {symbol}</b>\n"
+    "\n"
+    "📊 <b>Score: {total_score:.1f}/10</b>\n"
+    "├─ Macro:       {macro:+.0f} ({macro_summary})\n"
+    "├─ Marché:      {market:+.0f} ({market_summary})\n"
+    "├─ Fondamental: {fundamental:+.1f} ({fundamental_summary})\n"
+    "└─ Sentiment:   {sentiment:+.1f} ({sentiment_summary})\n"
+    "\n"
+    "💰 Prix: {price}\n"
+    "\n"
+    "<i>ID: {short_id}</i>\n"
+    "<i>Utilisez /review plus tard pour noter ce signal</i>"
+)
+
+_DAILY_SUMMARY_TEMPLATE = (
+    "📈 <b>RÉSUMÉ PITRADER</b>\n"
+    "{date}\n"
+    "\n"
+    "<b>Contexte</b>\n"
+    "├─ {macro_emoji} Macro: {macro_score:+d}\n"
+    "└─ {market_emoji} Marché: {market_score:+d}\n"
+    "\n"
+    "<b>Signaux générés: {signals_count}</b>\n"
+)
+
+
+def _format_price(price: Optional[float]) -> str:
+    """Prix en dollars, '?' si inconnu"""
+    return f"${price:.2f}" if price is not None else "?"
+
 
 @dataclass
 class TelegramMessage:
@@ -44,12 +90,21 @@ class TelegramBot:
     - Boutons inline pour notation
     """
 
+    # Limite Telegram pour un message texte
+    MAX_MESSAGE_LENGTH = 4096
+
     def __init__(self):
         self.token = config.telegram.bot_token
         self.chat_id = config.telegram.chat_id
         self.channel_id = config.telegram.channel_id  # Channel optionnel
         self.enabled = config.telegram.enabled and bool(self.token)
         self.base_url = f"https://api.telegram.org/bot{self.token}"
+        self._review_prices = TTLCache(maxsize=100, ttl=REVIEW_PRICE_TTL)
+        # Connexion TLS keep-alive vers api.telegram.org (un seul hôte)
+        self.session = create_session(pool_size=2)
+        self.session.headers.update(_JSON_HEADERS)
+        # File d'envoi (None = envoi synchrone, voir start_background)
+        self._queue: Optional[queue.Queue] = None
 
         if not self.enabled:
             logger.warning("Telegram not configured or disabled")
@@ -74,15 +129,58 @@ class TelegramBot:
         """
         url = f"{self.base_url}/{method}"
 
-        response = requests.post(url, json=data, timeout=30)
+        # Corps encodé via orjson si disponible (plus rapide que json= de requests)
+        response = self.session.post(url, data=dumps(data), timeout=30)
         response.raise_for_status()
 
-        result = response.json()
+        result = loads(response.content)
         if not result.get("ok"):
             raise ValueError(f"Telegram error: {result.get('description')}")
 
         return result
 
+    def start_background(self):
+        """
+        Active l'envoi en arrière-plan
+
+        send_message() met le message en file et rend la main immédiatement
+        (True = mis en file). Les erreurs sont journalisées par le thread
+        d'envoi. La file est vidée à la sortie du programme (flush).
+        """
+        if self._queue is not None or not self.enabled:
+            return
+
+        self._queue = queue.Queue()
+        threading.Thread(target=self._drain, name="telegram-sender", daemon=True).start()
+        atexit.register(self.flush, FLUSH_TIMEOUT)
+
+    def _drain(self):
+        """Boucle du thread d'envoi (ordre des messages conservé)"""
+        while True:
+            method, data = self._queue.get()
+            try:
+                self._send_request(method, data)
+            except Exception as e:
+                logger.error(f"Failed to send message: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend l'envoi des messages en file
+
+        Args:
+            timeout: Attente max en secondes (None = illimitée)
+
+        Returns:
+            True si la file est vide
+        """
+        q = self._queue
+        if q is None:
+            return True
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout)
+
     def send_message(
         self,
         text: str,
@@ -119,6 +217,10 @@ class TelegramBot:
             if reply_markup:
                 data["reply_markup"] = reply_markup
 
+            if self._queue is not None:
+                self._queue.put(("sendMessage", data))
+                return True
+
             self._send_request("sendMessage", data)
             return True
 
@@ -126,6 +228,43 @@ class TelegramBot:
             logger.error(f"Failed to send message: {e}")
             return False
 
+    def send_batch(self, messages: List[str], to_channel: bool = False) -> bool:
+        """
+        Regroupe plusieurs messages dans le minimum de sendMessage
+
+        Les messages sont concaténés tant que la limite Telegram
+        (4096 caractères) n'est pas atteinte.
+
+        Args:
+            messages: Textes à envoyer (HTML supporté)
+            to_channel: Force l'envoi au channel si configuré
+
+        Returns:
+            True si tous les envois ont réussi
+        """
+        chunks = []
+        current = ""
+
+        for text in messages:
+            if not text:
+                continue
+            candidate = f"{current}\n\n{text}" if current else text
+            if len(candidate) <= self.MAX_MESSAGE_LENGTH:
+                current = candidate
+            else:
+                if current:
+                    chunks.append(current)
+                current = text
+
+        if current:
+            chunks.append(current)
+
+        success = True
+        for chunk in chunks:
+            success = self.send_message(chunk, to_channel=to_channel) and success
+
+        return success
+
     def send_signal_alert(self, signal: SignalRecord) -> bool:
         """
         Envoie une alerte de signal
@@ -138,20 +277,22 @@ class TelegramBot:
         Returns:
             True si succès
         """
-        # Construire le message
+        # Construire le message (scores absents = 0)
         scores = signal.scores
-        text = f"""🚨 <b>SIGNAL ACHAT: {signal.symbol}</b>
-
-📊 <b>Score: {signal.total_score:.1f}/10</b>
-├─ Macro:       {scores.get('macro', 0):+.0f} ({signal.macro_summary})
-├─ Marché:      {scores.get('market', 0):+.0f} ({signal.market_summary})
-├─ Fondamental: {scores.get('fundamental', 0):+.1f} ({signal.fundamental_summary})
-└─ Sentiment:   {scores.get('sentiment', 0):+.1f} ({signal.sentiment_summary})
-
-💰 Prix: ${signal.price_at_signal:.2f}
-
-<i>ID: {signal.id[:8]}</i>
-<i>Utilisez /review plus tard pour noter ce signal</i>"""
+        text = _SIGNAL_TEMPLATE.format_map({
+            "symbol": signal.symbol,
+            "total_score": signal.total_score,
+            "macro": scores.get("macro", 0),
+            "market": scores.get("market", 0),
+            "fundamental": scores.get("fundamental", 0),
+            "sentiment": scores.get("sentiment", 0),
+            "macro_summary": signal.macro_summary,
+            "market_summary": signal.market_summary,
+            "fundamental_summary": signal.fundamental_summary,
+            "sentiment_summary": signal.sentiment_summary,
+            "price": _format_price(signal.price_at_signal),
+            "short_id": signal.id[:8],
+        })
 
         # Publier dans le channel si configuré
         return self.send_message(text, to_channel=True)
@@ -173,18 +314,14 @@ class TelegramBot:
 
         text = f"📋 <b>SIGNAUX À NOTER ({len(signals)})</b>\n\n"
 
+        # Prix actuels: une requête batch pour les symboles distincts
+        prices = self._current_prices(list(dict.fromkeys(s.symbol for s in signals)))
+
         for i, s in enumerate(signals, 1):
-            # Récupérer prix actuel
-            current_price = None
+            current_price = prices.get(s.symbol)
             return_pct = None
-
-            try:
-                quote = twelve_data_client.get_quote(s.symbol)
-                if quote.is_valid and quote.price and s.price_at_signal:
-                    current_price = quote.price
-                    return_pct = (current_price - s.price_at_signal) / s.price_at_signal * 100
-            except Exception:
-                pass
+            if current_price and s.price_at_signal:
+                return_pct = (current_price - s.price_at_signal) / s.price_at_signal * 100
 
             # Formater date
             try:
@@ -199,12 +336,47 @@ class TelegramBot:
                 sign = "+" if return_pct >= 0 else ""
                 text += f"{i}. <b>{s.symbol}</b> ({date_str}) - ${s.price_at_signal:.2f} → ${current_price:.2f} ({sign}{return_pct:.1f}%)\n"
             else:
-                text += f"{i}. <b>{s.symbol}</b> ({date_str}) - ${s.price_at_signal:.2f}\n"
+                text += f"{i}. <b>{s.symbol}</b> ({date_str}) - {_format_price(s.price_at_signal)}\n"
 
         text += "\n<i>Envoyez le numéro pour noter (ex: 1)</i>"
 
         return self.send_message(text)
 
+    def _current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Prix actuels des symboles, via le cache court de /review
+
+        Seuls les symboles absents du cache sont demandés à Twelve Data
+        (TwelveDataClient.get_prices: caches de get_quote, puis batch).
+
+        Returns:
+            Dict symbole -> prix (symboles sans cotation valide omis)
+        """
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            price = self._review_prices.get(symbol)
+            if price is None:
+                missing.append(symbol)
+            else:
+                prices[symbol] = price
+
+        if not missing:
+            return prices
+
+        try:
+            fetched = twelve_data_client.get_prices(missing)
+        except Exception as e:
+            logger.warning(f"Failed to fetch review prices: {e}")
+            return prices
+
+        for symbol, price in fetched.items():
+            if price:
+                prices[symbol] = price
+                self._review_prices.set(symbol, price)
+
+        return prices
+
     def send_rating_prompt(self, signal: SignalRecord, current_price: Optional[float] = None) -> bool:
         """
         Envoie le prompt de notation avec boutons
@@ -225,8 +397,8 @@ class TelegramBot:
 
         text = f"""📝 <b>Noter: {signal.symbol}</b>
 
-Prix signal: ${signal.price_at_signal:.2f}
-Prix actuel: ${current_price:.2f if current_price else '?'}{return_str}
+Prix signal: {_format_price(signal.price_at_signal)}
+Prix actuel: {_format_price(current_price)}{return_str}
 
 Score initial: {signal.total_score:.1f}/10
 
@@ -317,6 +489,42 @@ Choisissez une note:"""
         Returns:
             True si succès
         """
+        text = self.format_debug_stock_analysis(
+            symbol, momentum, ma50_distance, rsi, news_count,
+            positive_count, negative_count, neutral_count,
+            sentiment_score, sentiment_confidence
+        )
+
+        # Envoyer au DM (chat_id), pas au channel
+        return self.send_message(text, to_channel=False)
+
+    def send_debug_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Envoie les détails de plusieurs actions en un minimum de messages
+
+        Args:
+            rows: Arguments de format_debug_stock_analysis, un dict par action
+
+        Returns:
+            True si succès
+        """
+        texts = [self.format_debug_stock_analysis(**row) for row in rows]
+        return self.send_batch(texts, to_channel=False)
+
+    def format_debug_stock_analysis(
+        self,
+        symbol: str,
+        momentum: float,
+        ma50_distance: Optional[float] = None,
+        rsi: Optional[float] = None,
+        news_count: int = 0,
+        positive_count: int = 0,
+        negative_count: int = 0,
+        neutral_count: int = 0,
+        sentiment_score: float = 0.0,
+        sentiment_confidence: float = 0.0
+    ) -> str:
+        """Formate le bloc debug d'une action (voir send_debug_stock_analysis)"""
         # Emoji momentum
         if momentum > 2:
             mom_emoji = "🟢"
@@ -344,8 +552,7 @@ Choisissez une note:"""
 📰 {news_count} news ({sent_str})
 🤖 Sentiment: {sentiment_score:.1f}/3 (conf: {conf_str})"""
 
-        # Envoyer au DM (chat_id), pas au channel
-        return self.send_message(text, to_channel=False)
+        return text
 
     def send_startup_notification(self, watchlist_count: int, ollama_available: bool) -> bool:
         """
@@ -358,25 +565,46 @@ Choisissez une note:"""
         Returns:
             True si succès
         """
+        text = self.format_startup_notification(watchlist_count, ollama_available)
+
+        # Envoyer au DM (pas au channel)
+        return self.send_message(text, to_channel=False)
+
+    def format_startup_notification(
+        self,
+        watchlist_count: int,
+        ollama_available: bool,
+        in_progress: bool = True
+    ) -> str:
+        """
+        Construit le message de démarrage
+
+        Args:
+            watchlist_count: Nombre d'actions surveillées
+            ollama_available: Si Ollama est disponible
+            in_progress: Ajoute la mention "Analyse en cours..."
+
+        Returns:
+            Texte HTML du message
+        """
         from datetime import datetime
         import platform
 
-        # Récupérer uptime système
+        # Récupérer uptime système (lecture brute: pas de pile io pour 30 octets)
         try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-                uptime_min = int(uptime_seconds // 60)
-                uptime_str = f"{uptime_min} min" if uptime_min < 60 else f"{uptime_min // 60}h {uptime_min % 60}min"
-        except (FileNotFoundError, IOError):
+            fd = os.open('/proc/uptime', os.O_RDONLY)
+            try:
+                uptime_seconds = float(os.read(fd, 64).split()[0])
+            finally:
+                os.close(fd)
+            uptime_min = int(uptime_seconds // 60)
+            uptime_str = f"{uptime_min} min" if uptime_min < 60 else f"{uptime_min // 60}h {uptime_min % 60}min"
+        except (OSError, ValueError, IndexError):
             uptime_str = "N/A"
 
-        # Récupérer température CPU (Raspberry Pi)
-        try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                cpu_temp = int(f.read()) / 1000
-                temp_str = f"{cpu_temp:.1f}°C"
-        except (FileNotFoundError, IOError):
-            temp_str = "N/A"
+        # Récupérer température CPU (Raspberry Pi, 0.0 si indisponible)
+        cpu_temp = get_cpu_temperature()
+        temp_str = f"{cpu_temp:.1f}°C" if cpu_temp > 0 else "N/A"
 
         ollama_emoji = "✅" if ollama_available else "⚠️"
         ollama_status = "Actif" if ollama_available else "Fallback"
@@ -391,12 +619,12 @@ Choisissez une note:"""
 
 <b>Configuration</b>
 ├─ Actions: {watchlist_count}
-└─ {ollama_emoji} Ollama: {ollama_status}
+└─ {ollama_emoji} Ollama: {ollama_status}"""
 
-<i>Analyse en cours...</i>"""
+        if in_progress:
+            text += "\n\n<i>Analyse en cours...</i>"
 
-        # Envoyer au DM (pas au channel)
-        return self.send_message(text, to_channel=False)
+        return text
 
     def send_completion_notification(self, signals_count: int, duration_seconds: int, error: Optional[str] = None) -> bool:
         """
@@ -457,20 +685,17 @@ Choisissez une note:"""
         macro_emoji = "🟢" if macro_score >= 0 else "🟡" if macro_score >= -1 else "🔴"
         market_emoji = "🟢" if market_score >= 0 else "🟡" if market_score >= -1 else "🔴"
 
-        text = f"""📈 <b>RÉSUMÉ PITRADER</b>
-{datetime.now().strftime('%d/%m/%Y %H:%M')}
-
-<b>Contexte</b>
-├─ {macro_emoji} Macro: {macro_score:+d}
-└─ {market_emoji} Marché: {market_score:+d}
-
-<b>Signaux générés: {signals_count}</b>
-"""
+        text = _DAILY_SUMMARY_TEMPLATE.format_map({
+            "date": datetime.now().strftime('%d/%m/%Y %H:%M'),
+            "macro_emoji": macro_emoji,
+            "macro_score": macro_score,
+            "market_emoji": market_emoji,
+            "market_score": market_score,
+            "signals_count": signals_count,
+        })
 
         if top_picks:
-            text += "\n<b>Top picks:</b>\n"
-            for pick in top_picks[:3]:
-                text += f"• {pick}\n"
+            text += "\n<b>Top picks:</b>\n" + "".join(f"• {pick}\n" for pick in top_picks[:3])
 
         # Publier dans le channel si configuré
         return self.send_message(text, to_channel=True)
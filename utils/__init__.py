@@ -4,11 +4,16 @@ utils - Utilitaires pour PiTrader
 Modules:
 - decorators: Retry, Circuit Breaker, Rate Limiter
 - memory: Gestion mémoire pour Raspberry Pi
-- cache: Cache LRU avec TTL
+- cache: Cache LRU avec TTL (mémoire et persistant)
+- serialization: JSON rapide (orjson si disponible)
+- http: Sessions HTTP partagées (import direct: utils.http)
 """
 from .decorators import retry_with_backoff, rate_limiter, CircuitBreaker
 from .memory import MemoryMonitor, memory_efficient, memory_scope
-from .cache import TTLCache, ttl_lru_cache
+from .cache import (
+    TTLCache, ShardedTTLCache, PersistentCache,
+    ttl_lru_cache, get_persistent_cache_manager
+)
 
 __all__ = [
     'retry_with_backoff',
@@ -18,5 +23,8 @@ __all__ = [
     'memory_efficient',
     'memory_scope',
     'TTLCache',
-    'ttl_lru_cache'
+    'ShardedTTLCache',
+    'PersistentCache',
+    'ttl_lru_cache',
+    'get_persistent_cache_manager'
 ]
@@ -9,18 +9,38 @@ Patterns implémentés:
 
 Optimisé pour Raspberry Pi 5 (4GB RAM)
 """
+import os
 import time
+import atexit
+import heapq
+import itertools
 import threading
-import json
+import weakref
 from functools import wraps
-from typing import Callable, Optional, Any, Dict
-from collections import OrderedDict
+from typing import Callable, Optional, Any, Dict, List, Tuple, Union
 from pathlib import Path
 import logging
 
+from utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
+class _Inflight:
+    """Calcul en cours pour une clé (partagé par les threads en attente)"""
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class _WeakValue(weakref.ref):
+    """Référence faible stockée par un TTLCache(weak=True)"""
+    __slots__ = ()
+
+
 class TTLCache:
     """
     Cache LRU avec Time-To-Live
@@ -28,23 +48,48 @@ class TTLCache:
     Combine les avantages de LRU (limite mémoire) et TTL (fraîcheur données)
     Adapté pour Raspberry Pi avec 4GB RAM
 
+    Lectures sans verrou: get() ne fait que marquer la clé comme accédée,
+    l'éviction (sous verrou) donne une seconde chance aux clés marquées
+    (algorithme CLOCK, approximation de LRU).
+
+    weak=True: les valeurs sont gardées par référence faible et peuvent être
+    libérées par le GC dès que plus rien d'autre ne les utilise (une valeur
+    libérée compte comme absente). Les types sans support weakref (dict,
+    list, str, nombres) restent gardés normalement.
+
     Utilisation:
         cache = TTLCache(maxsize=100, ttl=300)
         cache.set("key", "value")
         value = cache.get("key")
     """
 
-    def __init__(self, maxsize: int = 100, ttl: int = 300):
+    def __init__(self, maxsize: int = 100, ttl: int = 300, weak: bool = False):
         """
         Args:
             maxsize: Nombre maximum d'entrées
             ttl: Time-to-live en secondes
+            weak: Garder les valeurs par référence faible
         """
         self.maxsize = maxsize
         self.ttl = ttl
-        self._cache: OrderedDict = OrderedDict()
-        self._timestamps: Dict[Any, float] = {}
+        self.weak = weak
+        # clé -> (timestamp, valeur): un seul dict à consulter/modifier.
+        # dict ordonné (3.7+): 2x plus compact qu'OrderedDict, ordre d'insertion
+        # == ordre CLOCK; "move_to_end" = suppression + réinsertion
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
         self._lock = threading.Lock()
+        # Horloge monotone: insensible aux sauts NTP (Pi sans RTC au boot),
+        # attribut d'instance pour éviter la recherche module dans le chemin chaud
+        self._now = time.monotonic
+        # Tas (timestamp, seq, clé) pour un nettoyage sans parcourir tout le dict.
+        # Les entrées périmées (clé mise à jour/supprimée) sont ignorées au pop;
+        # seq départage les ex-aequo sans comparer des clés hétérogènes.
+        self._expiry_heap: List[Tuple[float, int, Any]] = []
+        self._seq = itertools.count()
+        # Bits "accédé" du CLOCK: set.add() est atomique, pas besoin du verrou
+        self._accessed: set = set()
+        # Calculs en cours (get_or_compute): clé -> _Inflight
+        self._inflight: Dict[Any, _Inflight] = {}
 
     def get(self, key: Any) -> Optional[Any]:
         """
@@ -56,19 +101,25 @@ class TTLCache:
         Returns:
             Valeur ou None si non trouvée/expirée
         """
-        with self._lock:
-            if key not in self._cache:
-                return None
-
-            # Vérifier expiration
-            if time.time() - self._timestamps[key] > self.ttl:
-                del self._cache[key]
-                del self._timestamps[key]
-                return None
+        # dict.get() est atomique: pas de verrou pour une lecture
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        # Vérifier expiration (et libération d'une valeur faible)
+        timestamp, value = entry
+        if type(value) is _WeakValue:
+            value = value()
+        if value is None or self._now() - timestamp > self.ttl:
+            with self._lock:
+                # Ne pas supprimer une valeur réécrite entre-temps
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
+            return None
 
-            # Déplacer en fin (most recently used)
-            self._cache.move_to_end(key)
-            return self._cache[key]
+        # Marquer comme récemment utilisée (consulté à l'éviction)
+        self._accessed.add(key)
+        return value
 
     def set(self, key: Any, value: Any):
         """
@@ -79,15 +130,116 @@ class TTLCache:
             value: Valeur à stocker
         """
         with self._lock:
-            # Éviction si plein
-            while len(self._cache) >= self.maxsize:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                del self._timestamps[oldest_key]
+            # Mise à jour: pop pour réinsérer en fin (most recently used),
+            # un seul sondage du dict au lieu de "in" + del
+            if self._cache.pop(key, None) is None and self._cache \
+                    and len(self._cache) >= self.maxsize:
+                self._evict()
+
+            # Nouvelle clé: insérée directement en fin
+            if self.weak:
+                try:
+                    value = _WeakValue(value)
+                except TypeError:
+                    pass  # Type sans weakref: référence forte
+            now = self._now()
+            self._cache[key] = (now, value)
+            self._push_expiry(key, now)
+
+    def get_or_compute(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """
+        Récupère une valeur, ou la calcule une seule fois si absente
+
+        Les threads qui demandent la même clé pendant le calcul attendent
+        son résultat au lieu de relancer factory() (un seul appel API).
+        None n'est pas mis en cache.
 
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
-            self._cache.move_to_end(key)
+        Args:
+            key: Clé
+            factory: Fonction sans argument produisant la valeur
+
+        Returns:
+            Valeur en cache ou calculée (l'exception de factory est propagée)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        return self._compute(key, factory)
+
+    def _compute(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """get_or_compute() après un get() manqué (pas de seconde lecture hors verrou)"""
+        with self._lock:
+            # Re-vérifier sous verrou: un leader a pu publier sa valeur
+            # (set() puis retrait de _inflight) depuis le get() ci-dessus
+            value = self._live_value(self._cache.get(key))
+            if value is not None:
+                self._accessed.add(key)
+                return value
+            inflight = self._inflight.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight[key] = _Inflight()
+
+        if not leader:
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.value
+
+        try:
+            inflight.value = factory()
+            if inflight.value is not None:
+                self.set(key, inflight.value)
+            return inflight.value
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            inflight.event.set()
+
+    def _live_value(self, entry: Optional[Tuple[float, Any]]) -> Optional[Any]:
+        """Valeur d'une entrée si non expirée (même règle que get(), sans suppression)"""
+        if entry is None:
+            return None
+        timestamp, value = entry
+        if type(value) is _WeakValue:
+            value = value()
+        if value is None or self._now() - timestamp > self.ttl:
+            return None
+        return value
+
+    def _evict(self):
+        """Évince une entrée par CLOCK (appelé sous verrou)
+
+        La plus ancienne entrée est évincée sauf si elle a été lue depuis:
+        on efface alors son bit et elle repasse en fin. Termine en au plus
+        len(cache) + 1 tours puisque chaque tour efface un bit.
+        """
+        cache = self._cache
+        accessed = self._accessed
+        while True:
+            oldest = next(iter(cache))
+            if oldest in accessed:
+                accessed.discard(oldest)
+                cache[oldest] = cache.pop(oldest)
+            else:
+                del cache[oldest]
+                break
+        if len(accessed) > len(cache):
+            # Bits orphelins (clés supprimées pendant une lecture concurrente)
+            accessed.intersection_update(cache)
+
+    def _push_expiry(self, key: Any, timestamp: float):
+        """Ajoute une échéance au tas (appelé sous verrou)"""
+        heap = self._expiry_heap
+        if len(heap) > 2 * max(self.maxsize, len(self._cache)) + 16:
+            # Trop d'entrées périmées (mises à jour, évictions): reconstruire
+            heap[:] = [(ts, next(self._seq), k) for k, (ts, _) in self._cache.items()]
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, (timestamp, next(self._seq), key))
 
     def delete(self, key: Any) -> bool:
         """
@@ -100,41 +252,50 @@ class TTLCache:
             True si supprimée, False si non trouvée
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
-                return True
-            return False
+            self._accessed.discard(key)
+            return self._cache.pop(key, None) is not None
 
     def clear(self):
         """Vide le cache"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._expiry_heap.clear()
+            self._accessed.clear()
 
     def cleanup_expired(self) -> int:
         """
         Nettoie les entrées expirées
 
+        O(k log N) pour k entrées expirées (tas des échéances)
+
         Returns:
             Nombre d'entrées supprimées
         """
         with self._lock:
-            now = time.time()
-            expired = [
-                k for k, t in self._timestamps.items()
-                if now - t > self.ttl
-            ]
-            for key in expired:
-                del self._cache[key]
-                del self._timestamps[key]
-            return len(expired)
+            heap = self._expiry_heap
+            cache = self._cache
+            # TTL unique: ordre des timestamps == ordre des échéances
+            deadline = self._now() - self.ttl
+            count = 0
+            while heap and heap[0][0] < deadline:
+                timestamp, _, key = heapq.heappop(heap)
+                entry = cache.get(key)
+                # Ignorer les échéances périmées (clé réécrite ou déjà supprimée)
+                if entry is not None and entry[0] == timestamp:
+                    del cache[key]
+                    self._accessed.discard(key)
+                    count += 1
+            return count
 
     def __len__(self) -> int:
         return len(self._cache)
 
     def __contains__(self, key: Any) -> bool:
-        return self.get(key) is not None
+        """Présence d'une entrée non expirée (ne modifie pas l'ordre LRU)"""
+        entry = self._cache.get(key)
+        if entry is None or self._now() - entry[0] > self.ttl:
+            return False
+        return type(entry[1]) is not _WeakValue or entry[1]() is not None
 
     @property
     def stats(self) -> dict:
@@ -142,17 +303,91 @@ class TTLCache:
         return {
             "size": len(self._cache),
             "maxsize": self.maxsize,
-            "ttl": self.ttl
+            "ttl": self.ttl,
+            "weak": self.weak
+        }
+
+
+class ShardedTTLCache:
+    """
+    TTLCache découpé en N sous-caches, chacun avec son propre verrou
+
+    Réduit la contention quand plusieurs threads accèdent au même cache
+    (pool de téléchargement, bot Telegram en arrière-plan). L'éviction LRU
+    est locale à chaque shard: maxsize est réparti entre les shards.
+
+    Utilisation:
+        cache = ShardedTTLCache(maxsize=256, ttl=300, shards=8)
+    """
+
+    def __init__(self, maxsize: int = 100, ttl: int = 300, shards: int = 16):
+        """
+        Args:
+            maxsize: Nombre maximum d'entrées (total)
+            ttl: Time-to-live en secondes
+            shards: Nombre de sous-caches
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        per_shard = max(1, maxsize // shards)  # Ne jamais dépasser maxsize au total
+        self._shards = tuple(TTLCache(maxsize=per_shard, ttl=ttl) for _ in range(shards))
+
+    def _shard(self, key: Any) -> TTLCache:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Any) -> Optional[Any]:
+        return self._shard(key).get(key)
+
+    def set(self, key: Any, value: Any):
+        self._shard(key).set(key, value)
+
+    def get_or_compute(self, key: Any, factory: Callable[[], Any]) -> Any:
+        return self._shard(key).get_or_compute(key, factory)
+
+    def delete(self, key: Any) -> bool:
+        return self._shard(key).delete(key)
+
+    def clear(self):
+        for shard in self._shards:
+            shard.clear()
+
+    def cleanup_expired(self) -> int:
+        return sum(shard.cleanup_expired() for shard in self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._shard(key)
+
+    @property
+    def stats(self) -> dict:
+        """Statistiques du cache"""
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "shards": len(self._shards)
         }
 
 
-def ttl_lru_cache(maxsize: int = 128, ttl: int = 300):
+# Sépare positionnels et nommés dans la clé (même principe que functools)
+_KWD_MARK = object()
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    """Clé d'appel de ttl_lru_cache (construction inlinée dans le wrapper)"""
+    return args + (_KWD_MARK,) + tuple(kwargs.items()) if kwargs else args
+
+
+def ttl_lru_cache(maxsize: int = 128, ttl: int = 300, weak: bool = False):
     """
     Décorateur combinant lru_cache et TTL
 
     Args:
         maxsize: Nombre maximum d'entrées
         ttl: Time-to-live en secondes
+        weak: Résultats gardés par référence faible (voir TTLCache)
 
     Utilisation:
         @ttl_lru_cache(maxsize=50, ttl=300)
@@ -160,34 +395,47 @@ def ttl_lru_cache(maxsize: int = 128, ttl: int = 300):
             ...
     """
     def decorator(func: Callable):
-        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        cache = TTLCache(maxsize=maxsize, ttl=ttl, weak=weak)
+        # Méthodes liées une fois: pas de recherche d'attribut par appel
+        cache_get = cache.get
+        cache_compute = cache._compute
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Créer clé hashable
+            # Créer clé hashable: args tel quel dans le cas courant (pas d'allocation),
+            # kwargs dans l'ordre d'appel sinon (comme functools.lru_cache)
+            key = args + (_KWD_MARK,) + tuple(kwargs.items()) if kwargs else args
+
+            # Chercher en cache (lecture sans verrou)
             try:
-                key = (args, tuple(sorted(kwargs.items())))
+                result = cache_get(key)
             except TypeError:
                 # Si args non hashable, exécuter sans cache
                 return func(*args, **kwargs)
-
-            # Chercher en cache
-            result = cache.get(key)
             if result is not None:
-                logger.debug(f"Cache hit for {func.__name__}")
+                logger.debug("Cache hit for %s", func.__name__)
                 return result
 
-            # Exécuter et mettre en cache
-            result = func(*args, **kwargs)
-            if result is not None:  # Ne pas cacher None
-                cache.set(key, result)
+            # Exécuter et mettre en cache (None non caché); les appels
+            # concurrents sur la même clé attendent ce calcul. _compute:
+            # pas de second get(), seule la re-vérification sous verrou
+            return cache_compute(key, lambda: func(*args, **kwargs))
+
+        def cache_peek(*args, **kwargs):
+            """Résultat en cache pour ces arguments, sans appeler func (None si absent)"""
+            return cache.get(_make_key(args, kwargs))
 
-            return result
+        def cache_put(value, *args, **kwargs):
+            """Enregistre un résultat obtenu autrement (ex: requête batch)"""
+            if value is not None:
+                cache.set(_make_key(args, kwargs), value)
 
         # Exposer méthodes utilitaires
         wrapper.cache_clear = cache.clear
         wrapper.cache_cleanup = cache.cleanup_expired
         wrapper.cache_info = lambda: cache.stats
+        wrapper.cache_peek = cache_peek
+        wrapper.cache_put = cache_put
 
         return wrapper
     return decorator
@@ -203,9 +451,10 @@ class CacheManager:
     """
 
     def __init__(self):
-        self.caches: Dict[str, TTLCache] = {}
+        self.caches: Dict[str, Union[TTLCache, ShardedTTLCache]] = {}
 
-    def register(self, name: str, maxsize: int, ttl: int) -> TTLCache:
+    def register(self, name: str, maxsize: int, ttl: int,
+                 shards: int = 1) -> Union[TTLCache, ShardedTTLCache]:
         """
         Enregistre un nouveau cache
 
@@ -213,16 +462,20 @@ class CacheManager:
             name: Nom du cache
             maxsize: Taille maximum
             ttl: Time-to-live
+            shards: > 1 pour un cache partagé entre threads (ShardedTTLCache)
 
         Returns:
-            Instance TTLCache
+            Instance TTLCache (ou ShardedTTLCache)
         """
-        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        if shards > 1:
+            cache = ShardedTTLCache(maxsize=maxsize, ttl=ttl, shards=shards)
+        else:
+            cache = TTLCache(maxsize=maxsize, ttl=ttl)
         self.caches[name] = cache
         logger.debug(f"Registered cache '{name}' (maxsize={maxsize}, ttl={ttl})")
         return cache
 
-    def get(self, name: str) -> Optional[TTLCache]:
+    def get(self, name: str) -> Optional[Union[TTLCache, ShardedTTLCache]]:
         """Récupère un cache par son nom"""
         return self.caches.get(name)
 
@@ -261,10 +514,19 @@ class PersistentCache(TTLCache):
     """
     Cache persistant qui survit aux redémarrages
 
-    Sauvegarde sur disque en JSON et recharge au démarrage.
-    Utile pour éviter de refaire des appels API après un reboot.
+    Sauvegarde sur disque en JSON (orjson si disponible) et recharge au
+    démarrage. Utile pour éviter de refaire des appels API après un reboot.
+
+    En mémoire les timestamps sont monotones; sur disque ils restent en
+    heure murale (l'horloge monotone repart de zéro au reboot).
+
+    Les sauvegardes sont faites par un thread d'arrière-plan, SAVE_DELAY
+    secondes après la dernière écriture (une rafale de set() = une écriture
+    sur la carte SD), et une dernière fois à la sortie du programme.
     """
 
+    SAVE_DELAY = 0.5  # Secondes de regroupement des écritures
+
     def __init__(self, filepath: Path, maxsize: int = 100, ttl: int = 300):
         """
         Args:
@@ -274,18 +536,42 @@ class PersistentCache(TTLCache):
         """
         super().__init__(maxsize=maxsize, ttl=ttl)
         self.filepath = Path(filepath)
+        # Sérialise save(): thread de fond et atexit partagent le .tmp
+        self._save_lock = threading.Lock()
+        self._dirty = threading.Event()
         self._load()
 
+        threading.Thread(
+            target=self._save_loop, name=f"cache-save-{self.filepath.stem}", daemon=True
+        ).start()
+        atexit.register(self.flush)
+
+    def _save_loop(self):
+        """Boucle du thread de sauvegarde (écritures regroupées)"""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.SAVE_DELAY)
+            # Effacé avant save(): un set() pendant l'écriture en relance une
+            self._dirty.clear()
+            self.save()
+
+    def flush(self):
+        """Sauvegarde immédiate si des écritures sont en attente"""
+        if self._dirty.is_set():
+            self._dirty.clear()
+            self.save()
+
     def _load(self):
         """Charge le cache depuis le fichier"""
         if not self.filepath.exists():
             return
 
         try:
-            with open(self.filepath, "r") as f:
-                data = json.load(f)
+            data = loads(self.filepath.read_bytes())
 
             now = time.time()
+            # Décalage heure murale -> monotone, calculé une seule fois
+            offset = now - self._now()
             loaded = 0
 
             for key, entry in data.items():
@@ -294,49 +580,55 @@ class PersistentCache(TTLCache):
 
                 # Ne charger que les entrées non expirées
                 if now - timestamp < self.ttl:
-                    self._cache[key] = value
-                    self._timestamps[key] = timestamp
+                    self._cache[key] = (timestamp - offset, value)
+                    self._push_expiry(key, timestamp - offset)
                     loaded += 1
 
             if loaded > 0:
                 logger.info(f"Loaded {loaded} entries from {self.filepath.name}")
 
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             logger.warning(f"Failed to load cache from {self.filepath}: {e}")
 
     def save(self):
-        """Sauvegarde le cache sur disque"""
-        try:
-            self.filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            with self._lock:
-                data = {}
-                for key in self._cache:
-                    # Convertir la clé en string pour JSON
-                    str_key = str(key)
-                    data[str_key] = {
-                        "ts": self._timestamps[key],
-                        "val": self._cache[key]
-                    }
-
-            with open(self.filepath, "w") as f:
-                json.dump(data, f)
-
-            logger.debug(f"Saved {len(data)} entries to {self.filepath.name}")
-
-        except (IOError, TypeError) as e:
-            logger.warning(f"Failed to save cache to {self.filepath}: {e}")
+        """Sauvegarde le cache sur disque (écriture atomique)"""
+        tmp = self.filepath.with_name(f".{self.filepath.name}.tmp")
+        with self._save_lock:
+            try:
+                self.filepath.parent.mkdir(parents=True, exist_ok=True)
+
+                with self._lock:
+                    # Monotone -> heure murale pour survivre au redémarrage
+                    offset = time.time() - self._now()
+                    data = {}
+                    for key, (timestamp, value) in self._cache.items():
+                        # Convertir la clé en string pour JSON
+                        str_key = str(key)
+                        data[str_key] = {
+                            "ts": timestamp + offset,
+                            "val": value
+                        }
+
+                # default=None: un type non sérialisable lève TypeError (pas de str())
+                tmp.write_bytes(dumps(data, default=None))
+                # Remplacement atomique: pas de fichier tronqué après coupure courant
+                os.replace(tmp, self.filepath)
+
+                logger.debug(f"Saved {len(data)} entries to {self.filepath.name}")
+
+            except (IOError, TypeError) as e:
+                logger.warning(f"Failed to save cache to {self.filepath}: {e}")
+                tmp.unlink(missing_ok=True)
 
     def set(self, key: Any, value: Any):
-        """Stocke et sauvegarde"""
+        """Stocke et programme une sauvegarde (sans attendre le disque)"""
         super().set(key, value)
-        # Sauvegarder périodiquement (pas à chaque set pour performance)
-        if len(self._cache) % 10 == 0:
-            self.save()
+        self._dirty.set()
 
     def clear(self):
         """Vide le cache et le fichier"""
         super().clear()
+        self._dirty.clear()
         if self.filepath.exists():
             self.filepath.unlink()
 
@@ -352,6 +644,7 @@ class PersistentCacheManager:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.caches: Dict[str, PersistentCache] = {}
+        self._lock = threading.Lock()
 
     def get_or_create(self, name: str, maxsize: int = 100, ttl: int = 300) -> PersistentCache:
         """
@@ -365,12 +658,15 @@ class PersistentCacheManager:
         Returns:
             PersistentCache instance
         """
-        if name not in self.caches:
-            filepath = self.cache_dir / f"{name}.json"
-            self.caches[name] = PersistentCache(filepath, maxsize, ttl)
-            logger.debug(f"Created persistent cache '{name}'")
+        # Verrou: deux créations concurrentes lanceraient deux threads de
+        # sauvegarde écrivant le même fichier temporaire
+        with self._lock:
+            if name not in self.caches:
+                filepath = self.cache_dir / f"{name}.json"
+                self.caches[name] = PersistentCache(filepath, maxsize, ttl)
+                logger.debug(f"Created persistent cache '{name}'")
 
-        return self.caches[name]
+            return self.caches[name]
 
     def save_all(self):
         """Sauvegarde tous les caches"""
@@ -389,13 +685,16 @@ cache_manager = CacheManager()
 
 # Gestionnaire de caches persistants (initialisé après import de config)
 _persistent_cache_manager: Optional[PersistentCacheManager] = None
+_persistent_cache_manager_lock = threading.Lock()
 
 
 def get_persistent_cache_manager() -> PersistentCacheManager:
     """Retourne le gestionnaire de caches persistants"""
     global _persistent_cache_manager
     if _persistent_cache_manager is None:
-        # Import tardif pour éviter import circulaire
-        from config import config
-        _persistent_cache_manager = PersistentCacheManager(config.cache_dir)
+        with _persistent_cache_manager_lock:
+            if _persistent_cache_manager is None:
+                # Import tardif pour éviter import circulaire
+                from config import config
+                _persistent_cache_manager = PersistentCacheManager(config.cache_dir)
     return _persistent_cache_manager
@@ -9,12 +9,13 @@ Patterns implémentés:
 
 Optimisé pour Raspberry Pi 5 (4GB RAM)
 """
+import os
 import time
 import functools
+import threading
 import logging
 from typing import Callable, Tuple, Type, Optional
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +79,11 @@ def retry_with_backoff(
     return decorator
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
-    """État du circuit breaker"""
+    """État du circuit breaker (slots: pas de __dict__ par instance)"""
     failures: int = 0
-    last_failure: Optional[datetime] = None
+    last_failure: Optional[float] = None  # time.monotonic()
     state: str = "closed"  # closed, open, half-open
 
 
@@ -142,8 +143,7 @@ class CircuitBreaker:
     def _should_attempt_reset(self) -> bool:
         if self._state.last_failure is None:
             return True
-        elapsed = datetime.now() - self._state.last_failure
-        return elapsed > timedelta(seconds=self.recovery_timeout)
+        return time.monotonic() - self._state.last_failure > self.recovery_timeout
 
     def _on_success(self):
         if self._state.state == "half-open":
@@ -153,7 +153,7 @@ class CircuitBreaker:
 
     def _on_failure(self):
         self._state.failures += 1
-        self._state.last_failure = datetime.now()
+        self._state.last_failure = time.monotonic()
         if self._state.failures >= self.failure_threshold:
             self._state.state = "open"
             logger.warning(
@@ -186,36 +186,64 @@ def rate_limiter(calls_per_minute: int = 30):
     min_interval = 60.0 / calls_per_minute
 
     def decorator(func: Callable):
-        last_call = [0.0]  # Mutable pour closure
+        last_call = float("-inf")
+        # Threads concurrents: chacun attend son créneau (sleep sous verrou)
+        lock = threading.Lock()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_call[0]
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                time.sleep(sleep_time)
+            nonlocal last_call
+            with lock:
+                # Intervalle entre deux débuts d'appel (ce que compte l'API)
+                now = time.perf_counter()
+                wait = min_interval - (now - last_call)
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.perf_counter()
+                last_call = now
 
-            result = func(*args, **kwargs)
-            last_call[0] = time.time()
-            return result
+            return func(*args, **kwargs)
 
         return wrapper
     return decorator
 
 
+CPU_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+# Descripteur gardé ouvert: un pread() par lecture au lieu de open/read/close
+# (sysfs régénère la valeur à chaque lecture à l'offset 0)
+try:
+    _TEMP_FD = os.open(CPU_TEMP_PATH, os.O_RDONLY)
+except OSError:
+    _TEMP_FD = -1  # Non-RPi
+
+# La température varie à l'échelle de la seconde: dernière lecture réutilisée
+CPU_TEMP_TTL = 1.0
+_last_temp_read = float("-inf")
+_last_temp_value = 0.0
+
+
 def get_cpu_temperature() -> float:
     """
-    Lit la température CPU du Raspberry Pi
+    Lit la température CPU du Raspberry Pi (mise en cache CPU_TEMP_TTL s)
 
     Returns:
         Température en Celsius, ou 0.0 si non disponible
     """
+    global _last_temp_read, _last_temp_value
+    if _TEMP_FD < 0:
+        return 0.0
+
+    now = time.monotonic()
+    if now - _last_temp_read < CPU_TEMP_TTL:
+        return _last_temp_value
+
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            temp = float(f.read().strip()) / 1000.0
-            return temp
-    except (FileNotFoundError, ValueError, PermissionError):
-        return 0.0  # Non-RPi ou erreur
+        _last_temp_value = float(os.pread(_TEMP_FD, 16, 0)) / 1000.0
+    except (OSError, ValueError):
+        return 0.0  # Erreur de lecture
+    _last_temp_read = now
+    return _last_temp_value
 
 
 def thermal_aware(warning_temp: float = 70.0, critical_temp: float = 80.0, cooldown: float = 5.0):
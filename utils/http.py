@@ -0,0 +1,28 @@
+"""
+utils/http.py - Sessions HTTP partagées
+
+Une session requests par client réutilise les connexions TCP/TLS
+(keep-alive) au lieu d'ouvrir une nouvelle connexion à chaque appel.
+
+Les retries restent gérés par retry_with_backoff (pas de Retry urllib3
+pour ne pas multiplier les tentatives).
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 20) -> requests.Session:
+    """
+    Crée une session HTTP avec pool de connexions
+
+    Args:
+        pool_size: Nombre de connexions gardées ouvertes par hôte
+
+    Returns:
+        requests.Session configurée
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -7,19 +7,75 @@ Patterns implémentés:
 - Context managers pour scope mémoire
 - Générateurs pour traitement streaming
 
+PERF NOTES:
+- Le chemin chaud (get_memory_usage, get_process_memory) est borné par les
+  E/S /proc, pas par le calcul Python: le noyau régénère le fichier à chaque
+  lecture et c'est ce temps qui domine, pas le parsing.
+- Leviers dans l'ordre: lire moins souvent (cache _MEM_CACHE_TTL), lire un
+  fichier plus petit (/proc/self/statm plutôt que meminfo), garder le
+  descripteur ouvert (pread).
+- Inutile d'optimiser le parsing (extension C, vectorisation): le temps
+  noyau reste dominant.
+
 Optimisé pour Raspberry Pi 5 (4GB RAM)
 """
 import gc
+import os
 import sys
+import time
 import logging
-from typing import Generator, Iterable, TypeVar, Callable
+from typing import Generator, Iterable, TypeVar, Callable, Optional
 from contextlib import contextmanager
+from itertools import islice
 import functools
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Dernière mesure mémoire: la pression ne varie pas à l'échelle de 200ms,
+# inutile de relire /proc à chaque appel (check_and_cleanup, is_memory_low...)
+_MEM_CACHE_TTL = 0.2
+# "low": verdict is_memory_low précalculé avec la mesure
+_mem_cache = {"t": float("-inf"), "val": None, "low": False}
+
+# Seuils mémoire en bytes (pour 4GB system), globaux de module: lus
+# directement dans les chemins chauds sans passer par la classe
+_WARN = 3.0 * 1024**3   # 3GB utilisés = warning
+_CRIT = 3.5 * 1024**3   # 3.5GB = critical
+
+# Seuils GC (défaut CPython: 700, 10, 10). Génération 0 collectée toutes les
+# 10000 allocations au lieu de 700: moins de petites pauses pendant le
+# traitement des cotations, pour quelques Mo de déchets en plus au maximum
+GC_THRESHOLDS = (10000, 15, 15)
+
+# Pages de 16K sur le noyau Pi 5 par défaut: ne pas supposer 4096
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+# /proc/meminfo gardé ouvert: un pread() par mesure au lieu de open/read/close
+# (le noyau régénère le contenu à chaque lecture à l'offset 0)
+try:
+    _MEMINFO_FD = os.open('/proc/meminfo', os.O_RDONLY)
+except OSError:
+    _MEMINFO_FD = -1  # Non-Linux
+_MEMINFO_READ_SIZE = 4096  # Fichier complet ~1.5KB, les champs utiles en tête
+
+
+def _meminfo_field(data: bytes, name: bytes) -> int:
+    """Valeur en bytes d'un champ de /proc/meminfo (ex: b"MemTotal:" -> 4012345344)
+
+    Recherche directe dans les bytes: pas de découpage ligne par ligne
+    ni de dict pour les ~50 champs dont on n'a pas besoin.
+    """
+    start = data.find(name)
+    if start < 0:
+        return 0
+    end = data.find(b"\n", start)
+    return int(data[start + len(name):end if end >= 0 else None].split()[0]) * 1024  # kB -> bytes
+
 
 class MemoryMonitor:
     """
@@ -27,18 +83,34 @@ class MemoryMonitor:
     Déclenche GC et alertes si mémoire basse
     """
 
-    # Seuils en bytes (pour 4GB system)
-    WARNING_THRESHOLD = 3.0 * 1024**3   # 3GB utilisés = warning
-    CRITICAL_THRESHOLD = 3.5 * 1024**3  # 3.5GB = critical
+    # Seuils en bytes (lecture seule, les vérifications utilisent _WARN/_CRIT)
+    WARNING_THRESHOLD = _WARN
+    CRITICAL_THRESHOLD = _CRIT
 
     @staticmethod
-    def get_memory_usage() -> dict:
+    def get_memory_usage(force: bool = False) -> dict:
         """
-        Retourne utilisation mémoire actuelle
+        Retourne utilisation mémoire actuelle (mise en cache _MEM_CACHE_TTL s)
+
+        Args:
+            force: Ignorer le cache (mesure juste après un GC par exemple)
 
         Returns:
-            dict avec total, available, used, percent
+            dict avec total, available, used, percent (ne pas modifier: partagé)
         """
+        now = time.monotonic()
+        if not force and now - _mem_cache["t"] < _MEM_CACHE_TTL:
+            return _mem_cache["val"]
+
+        mem = MemoryMonitor._read_memory_usage()
+        _mem_cache["val"] = mem
+        _mem_cache["low"] = mem["used"] > _WARN
+        _mem_cache["t"] = now
+        return mem
+
+    @staticmethod
+    def _read_memory_usage() -> dict:
+        """Mesure mémoire système (psutil ou /proc/meminfo)"""
         try:
             import psutil
             mem = psutil.virtual_memory()
@@ -51,29 +123,40 @@ class MemoryMonitor:
         except ImportError:
             # Fallback sans psutil - lecture /proc/meminfo
             try:
-                with open('/proc/meminfo', 'r') as f:
-                    lines = f.readlines()
-                    meminfo = {}
-                    for line in lines:
-                        parts = line.split(':')
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = int(parts[1].strip().split()[0]) * 1024  # kB -> bytes
-                            meminfo[key] = value
-
-                    total = meminfo.get('MemTotal', 0)
-                    available = meminfo.get('MemAvailable', 0)
-                    used = total - available
-
-                    return {
-                        "total": total,
-                        "available": available,
-                        "used": used,
-                        "percent": (used / total * 100) if total > 0 else 0
-                    }
-            except (FileNotFoundError, ValueError):
+                if _MEMINFO_FD < 0:
+                    raise FileNotFoundError('/proc/meminfo')
+                data = os.pread(_MEMINFO_FD, _MEMINFO_READ_SIZE, 0)
+
+                total = _meminfo_field(data, b"MemTotal:")
+                available = _meminfo_field(data, b"MemAvailable:")
+                used = total - available
+
+                return {
+                    "total": total,
+                    "available": available,
+                    "used": used,
+                    "percent": (used / total * 100) if total > 0 else 0
+                }
+            except (OSError, ValueError):
                 return {"percent": 0, "available": float('inf'), "used": 0, "total": 0}
 
+    @staticmethod
+    def get_process_memory() -> int:
+        """
+        Mémoire résidente (RSS) du processus PiTrader
+
+        Lit /proc/self/statm (une ligne de 7 entiers): bien plus léger que
+        psutil.virtual_memory() ou /proc/meminfo pour surveiller le seul bot.
+
+        Returns:
+            RSS en bytes, ou 0 si non disponible (non-Linux)
+        """
+        try:
+            with open('/proc/self/statm', 'rb') as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            return 0
+
     @classmethod
     def check_and_cleanup(cls) -> bool:
         """
@@ -83,42 +166,96 @@ class MemoryMonitor:
             True si nettoyage effectué
         """
         mem = cls.get_memory_usage()
+        used = mem["used"]
 
-        if mem["used"] > cls.CRITICAL_THRESHOLD:
+        if used > _CRIT:
             logger.warning(f"Memory critical ({mem['percent']:.1f}%), forcing full GC...")
-            gc.collect(generation=2)  # Full GC
-            gc.collect()  # Double collect pour générations
+            gc.collect(generation=2)  # Full GC (toutes générations en un passage)
             return True
-        elif mem["used"] > cls.WARNING_THRESHOLD:
+        elif used > _WARN:
             logger.info(f"Memory elevated ({mem['percent']:.1f}%), running GC...")
             gc.collect(generation=1)
             return True
 
         return False
 
+    @classmethod
+    def tune_gc(cls):
+        """Applique les seuils GC_THRESHOLDS (à appeler au démarrage)"""
+        gc.set_threshold(*GC_THRESHOLDS)
+        logger.debug(f"GC thresholds: {gc.get_threshold()}")
+
+    @classmethod
+    def freeze_startup(cls):
+        """
+        Gèle les objets de démarrage (modules, config, clients)
+
+        À appeler une fois l'initialisation terminée: gc.freeze() les déplace
+        en génération permanente, les collectes suivantes (y compris la
+        collecte complète de check_and_cleanup) ne les parcourent plus.
+        """
+        gc.collect()  # Ne pas geler de déchets
+        gc.freeze()
+        logger.debug(f"GC: {gc.get_freeze_count()} objets gelés")
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """
+        Photo mémoire système + processus en une passe
+
+        Avec psutil, les lectures du processus sont regroupées dans
+        Process.oneshot() (un seul passage par /proc/self).
+
+        Returns:
+            dict avec system (voir get_memory_usage), rss (bytes),
+            rss_percent (% de la RAM totale)
+        """
+        mem = cls.get_memory_usage()
+        try:
+            import psutil
+        except ImportError:
+            rss = cls.get_process_memory()
+        else:
+            proc = psutil.Process()
+            with proc.oneshot():
+                rss = proc.memory_info().rss
+
+        total = mem.get("total", 0)
+        return {
+            "system": mem,
+            "rss": rss,
+            "rss_percent": (rss / total * 100) if total > 0 else 0.0
+        }
+
     @classmethod
     def log_stats(cls):
         """Log statistiques mémoire et GC"""
-        mem = cls.get_memory_usage()
-        gc_stats = gc.get_stats()
+        snap = cls.snapshot()
+        mem = snap["system"]
 
         available_mb = mem['available'] / (1024**2)
+        rss_mb = snap["rss"] / (1024**2)
         logger.info(
             f"Memory: {mem['percent']:.1f}% used, "
-            f"{available_mb:.0f}MB available"
+            f"{available_mb:.0f}MB available, "
+            f"{rss_mb:.0f}MB RSS"
         )
-        logger.debug(f"GC stats: {gc_stats}")
+        # gc.get_stats() alloue une liste de dicts: seulement si DEBUG actif
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"GC stats: {gc.get_stats()}")
 
     @classmethod
     def is_memory_low(cls) -> bool:
-        """Vérifie si la mémoire est basse"""
-        mem = cls.get_memory_usage()
-        return mem["used"] > cls.WARNING_THRESHOLD
+        """Vérifie si la mémoire est basse (verdict mis en cache avec la mesure)"""
+        if time.monotonic() - _mem_cache["t"] >= _MEM_CACHE_TTL:
+            cls.get_memory_usage(force=True)
+        return _mem_cache["low"]
 
 
 def memory_efficient(func: Callable) -> Callable:
     """
-    Décorateur qui force GC après exécution de fonctions lourdes
+    Décorateur qui lance un GC après exécution de fonctions lourdes,
+    seulement si la mémoire est basse
 
     Utilisation:
         @memory_efficient
@@ -131,37 +268,54 @@ def memory_efficient(func: Callable) -> Callable:
             result = func(*args, **kwargs)
             return result
         finally:
-            # Nettoyer après fonctions lourdes
-            gc.collect()
+            # Nettoyer après fonctions lourdes, sous pression mémoire uniquement
+            # (génération 1: pause courte au lieu d'un parcours complet du tas)
+            if MemoryMonitor.is_memory_low():
+                gc.collect(1)
 
     return wrapper
 
 
 @contextmanager
-def memory_scope():
+def memory_scope(min_allocs: int = 1000):
     """
     Context manager pour scope mémoire contrôlé
 
+    Args:
+        min_allocs: Allocations (conteneurs suivis par le GC) en dessous
+            desquelles la collecte de sortie est sautée
+
     Utilisation:
         with memory_scope():
             # Opérations lourdes
             data = load_large_data()
             process(data)
-        # GC automatique à la sortie
+        # GC automatique à la sortie (si le scope a alloué)
     """
+    start_count = gc.get_count()[0]
+    start_runs = gc.get_stats()[0]["collections"]
     try:
         yield
     finally:
-        gc.collect()
+        # Le compteur génération 0 repart de zéro à chaque collecte automatique:
+        # chaque collecte survenue entre-temps compte pour un seuil complet
+        runs = gc.get_stats()[0]["collections"] - start_runs
+        allocs = gc.get_count()[0] - start_count + runs * gc.get_threshold()[0]
+        if allocs > min_allocs:
+            gc.collect()
 
 
-def chunked_generator(iterable: Iterable[T], chunk_size: int) -> Generator:
+def chunked_generator(iterable: Iterable[T], chunk_size: int,
+                      reuse_buffer: bool = False) -> Generator:
     """
     Générateur qui traite par chunks pour économiser RAM
 
     Args:
         iterable: Itérable à traiter
         chunk_size: Taille des chunks
+        reuse_buffer: Réutiliser la même liste pour chaque chunk (pas
+            d'allocation par chunk). Le chunk est écrasé à l'itération
+            suivante: le consommer (ou le copier) avant de continuer.
 
     Yields:
         Chunks de l'itérable
@@ -170,39 +324,36 @@ def chunked_generator(iterable: Iterable[T], chunk_size: int) -> Generator:
         for chunk in chunked_generator(large_list, 100):
             process_chunk(chunk)
     """
+    it = iter(iterable)
     chunk = []
-    for item in iterable:
-        chunk.append(item)
-        if len(chunk) >= chunk_size:
-            yield chunk
-            chunk = []
-            gc.collect()  # GC entre chunks
-
-    if chunk:  # Dernier chunk
+    while True:
+        # Chunk construit en un appel C (pas d'append + len() par élément)
+        if reuse_buffer:
+            chunk[:] = islice(it, chunk_size)
+        else:
+            chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
         yield chunk
+        # GC entre chunks seulement sous pression mémoire (sinon pause inutile)
+        if MemoryMonitor.is_memory_low():
+            gc.collect(1)
 
 
-def lazy_property(func: Callable):
-    """
-    Property qui calcule la valeur une seule fois (lazy loading)
-    Évite calculs inutiles et économise mémoire
-
-    Utilisation:
-        class MyClass:
-            @lazy_property
-            def expensive_data(self):
-                return compute_expensive()
-    """
-    attr_name = f"_lazy_{func.__name__}"
+# Property qui calcule la valeur une seule fois (lazy loading).
+# functools.cached_property: descripteur non-data, la valeur est rangée dans
+# le __dict__ de l'instance et les accès suivants ne passent plus par Python.
+# Nécessite un __dict__ (pas de classe à __slots__ seuls).
+#
+# Utilisation:
+#     class MyClass:
+#         @lazy_property
+#         def expensive_data(self):
+#             return compute_expensive()
+lazy_property = functools.cached_property
 
-    @property
-    @functools.wraps(func)
-    def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, func(self))
-        return getattr(self, attr_name)
 
-    return wrapper
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def sizeof_fmt(num: float) -> str:
@@ -215,36 +366,69 @@ def sizeof_fmt(num: float) -> str:
     Returns:
         String formaté (ex: "1.5GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if abs(num) < 1024.0:
-            return f"{num:.1f}{unit}"
-        num /= 1024.0
-    return f"{num:.1f}TB"
+    # Unité depuis la magnitude binaire (bit_length): pas de boucle de divisions
+    magnitude = int(abs(num))
+    i = min((magnitude.bit_length() - 1) // 10, 4) if magnitude else 0
+    return f"{num / (1 << (i * 10)):.1f}{_SIZE_UNITS[i]}"
+
+
+# Types sans contenu à parcourir ni buffer: getsizeof suffit
+_SCALAR_TYPES = frozenset((int, float, bool, str, bytes, type(None)))
+
+
+def _array_size(o) -> Optional[int]:
+    """Taille d'un DataFrame/Series pandas ou ndarray numpy (None sinon)
+
+    Lue directement sur l'objet (C) au lieu de parcourir ses éléments.
+    """
+    memory_usage = getattr(o, "memory_usage", None)
+    if callable(memory_usage):  # pandas (deep: inclut les chaînes des colonnes object)
+        usage = memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    nbytes = getattr(o, "nbytes", None)
+    if isinstance(nbytes, int):  # numpy, memoryview
+        return nbytes
+    return None
 
 
 def get_object_size(obj) -> int:
     """
     Calcule taille mémoire d'un objet récursif
 
+    DataFrame/Series pandas et ndarray numpy sont mesurés directement
+    (memory_usage / nbytes) sans parcourir leurs éléments.
+
     Args:
         obj: Objet à mesurer
 
     Returns:
         Taille en bytes
     """
+    # Parcours itératif (pile explicite): pas de limite de récursion
+    # sur les structures profondes, pas d'appel Python par nœud
     seen = set()
-
-    def sizeof(o):
+    seen_add = seen.add
+    getsizeof = sys.getsizeof
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    total = 0
+
+    while stack:
+        o = pop()
         if id(o) in seen:
-            return 0
-        seen.add(id(o))
-        size = sys.getsizeof(o)
+            continue
+        seen_add(id(o))
 
         if isinstance(o, dict):
-            size += sum(sizeof(k) + sizeof(v) for k, v in o.items())
+            total += getsizeof(o)
+            extend(o.keys())
+            extend(o.values())
         elif isinstance(o, (list, tuple, set, frozenset)):
-            size += sum(sizeof(i) for i in o)
-
-        return size
+            total += getsizeof(o)
+            extend(o)
+        else:
+            array_size = None if type(o) in _SCALAR_TYPES else _array_size(o)
+            total += getsizeof(o) if array_size is None else array_size
 
-    return sizeof(obj)
+    return total
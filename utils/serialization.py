@@ -0,0 +1,100 @@
+"""
+utils/serialization.py - Sérialisation JSON rapide
+
+Utilise orjson (implémenté en C) si disponible, sinon le module json
+standard. Les deux chemins produisent/acceptent des bytes UTF-8, les
+fichiers existants restent donc lisibles quel que soit le backend.
+
+pack_record/unpack_record: format binaire msgpack (optionnel) pour les
+enregistrements de cache, avec relecture transparente des anciens JSON.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+# orjson.JSONDecodeError hérite de json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable] = str) -> bytes:
+    """
+    Sérialise en JSON (bytes UTF-8)
+
+    Args:
+        obj: Objet à sérialiser
+        indent: Indentation 2 espaces (lisibilité)
+        default: Conversion des types non supportés
+
+    Returns:
+        JSON encodé en bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        default=default,
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Désérialise du JSON
+
+    Args:
+        data: JSON en bytes ou str
+
+    Returns:
+        Objet Python
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def pack_record(obj: Any) -> bytes:
+    """
+    Sérialise un enregistrement de cache
+
+    msgpack si disponible (floats binaires, ~2x moins d'octets que JSON
+    pour les cotations/OHLC), sinon JSON compact.
+    """
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+    return dumps(obj)
+
+
+def unpack_record(data: bytes) -> Any:
+    """
+    Désérialise un enregistrement écrit par pack_record
+
+    Le format est détecté au premier octet: un objet JSON commence par '{',
+    une map msgpack jamais. Les fichiers JSON existants restent lisibles
+    (migration au fil des réécritures).
+
+    Raises:
+        ValueError: Données invalides ou msgpack requis mais absent
+    """
+    if data[:1] == b"{":
+        return loads(data)
+    if not MSGPACK_AVAILABLE:
+        raise ValueError("msgpack record but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)